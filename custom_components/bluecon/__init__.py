@@ -1,46 +1,127 @@
 """The BlueCon integration."""
 import asyncio
+from datetime import datetime, timedelta
+import functools
 import logging
+from typing import Any, Mapping, Optional, Tuple
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import CONF_PASSWORD, CONF_USERNAME, Platform
-from homeassistant.core import HomeAssistant
-from homeassistant.helpers.aiohttp_client import async_get_clientsession
-from homeassistant.helpers.storage import Store
+from homeassistant.const import CONF_PASSWORD, CONF_USERNAME, EVENT_HOMEASSISTANT_CLOSE, Platform
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.exceptions import ConfigEntryAuthFailed, ConfigEntryNotReady
+import homeassistant.helpers.config_validation as cv
+from homeassistant.helpers.dispatcher import async_dispatcher_send
+from homeassistant.helpers.event import async_track_time_interval
+from homeassistant.helpers.typing import ConfigType
 
-from .const import DOMAIN
-from .fermax_api import FermaxClient, FermaxAuthError
+from .const import CONF_ALTERNATE_HOST, CONF_DEDICATED_SESSION, CONF_HEDGE_DELAY, CONF_HEDGE_OPEN_DOOR, CONF_LOCK_STATE_RESET, CONF_OPEN_DOOR_COOLDOWN, CONF_PREDICTIVE_WARMING, DATA_FLOW_TOKENS, DOMAIN, SIGNAL_READY
+from .fermax_api import ALTERNATE_BASE_URLS, BASE_URLS, CONNECTION_IDLE_TIMEOUT, KEEPALIVE_TIMEOUT, FermaxClient, HedgePolicy, HostSelector, FermaxAuthError, FermaxConnectionError, FermaxError
+from .coordinator import BlueConDeviceCoordinator
+from .models import BlueConData, BlueConDomainData
+from .services import async_setup_services
+from .storage import PairingCache, TokenStore
+from .sync import async_fetch_snapshot, async_refresh_snapshot
+from .transport import FermaxTransport
+from .usage import UsageTracker
 
 LOGGER = logging.getLogger(__name__)
 
-PLATFORMS: list[str] = [Platform.LOCK] # Removed others for now as they might depend on features not in the script
+PLATFORMS: list[str] = [Platform.LOCK, Platform.SENSOR, Platform.BINARY_SENSOR]
+
+CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
+
+# Pairings are resynced this often to pick up shared and revoked doors
+PAIRING_RESYNC_INTERVAL = timedelta(hours=1)
+
+# Background login retry backoff, in seconds
+CONNECT_BACKOFF_MIN = 5
+CONNECT_BACKOFF_MAX = 300
+
+async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
+    """Set up the transport shared by all entries and the BlueCon services."""
+    transport = FermaxTransport(hass)
+    hass.data[DOMAIN] = BlueConDomainData(transport)
+    hass.bus.async_listen_once(EVENT_HOMEASSISTANT_CLOSE, transport.async_close)
+    async_setup_services(hass)
+    return True
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up BlueCon from a config entry."""
-    hass.data.setdefault(DOMAIN, {})
+    transport: FermaxTransport = hass.data[DOMAIN].transport
 
-    session = async_get_clientsession(hass)
-    store = Store(hass, 1, f"{DOMAIN}.{entry.entry_id}.token")
+    dedicated_session = entry.options.get(CONF_DEDICATED_SESSION, False)
+    session = transport.session(entry.entry_id, dedicated_session)
+    # Registered first so the session is released after everything using it
+    entry.async_on_unload(functools.partial(transport.async_release, entry.entry_id))
+    store = TokenStore(hass, entry.entry_id)
+    entry.async_on_unload(store.async_flush)
 
     token_data = await store.async_load()
+    if flow_token := hass.data.get(DATA_FLOW_TOKENS, {}).pop(entry.unique_id, None):
+        # Reuse the token the config flow just obtained
+        token_data = flow_token
+        store.async_save(token_data)
 
-    def save_token(token):
-        hass.async_create_task(store.async_save(token))
+    client = FermaxClient(
+        session,
+        token_data,
+        store.async_save,
+        open_door_cooldown=entry.options.get(CONF_OPEN_DOOR_COOLDOWN, 0),
+        scheduler=transport.scheduler,
+        hosts=_host_selector(entry.options),
+        hedge=_hedge_policy(entry.options),
+        keepalive_timeout=KEEPALIVE_TIMEOUT if dedicated_session else CONNECTION_IDLE_TIMEOUT,
+    )
+    entry.async_on_unload(client.async_stop)
+    client.start_host_probing()
+    if dedicated_session:
+        client.start_keepalive()
 
-    client = FermaxClient(session, token_data, save_token)
+    cache = PairingCache(hass, entry.entry_id)
+    data = BlueConData(
+        entry.entry_id,
+        client,
+        cache,
+        await cache.async_load(),
+        options=dict(entry.options),
+        credentials=_credentials(entry),
+    )
+    entry.async_on_unload(functools.partial(_async_stop_usage, data))
+    if entry.options.get(CONF_PREDICTIVE_WARMING, False):
+        await _async_start_usage(hass, entry, data)
 
-    try:
-        if not client.token_valid:
-            username = entry.data.get(CONF_USERNAME)
-            password = entry.data.get(CONF_PASSWORD)
-            if username and password:
-                await client.async_login(username, password)
-            else:
-                LOGGER.warning("No credentials found for re-authentication")
-    except FermaxAuthError as err:
-        LOGGER.error("Authentication failed during setup: %s", err)
-        return False
-
-    hass.data[DOMAIN][entry.entry_id] = client
+    if data.snapshot is None:
+        # Nothing cached to restore entities from, discovery has to succeed first
+        await transport.async_stagger()
+        try:
+            await _async_login(client, entry)
+            data.snapshot = await async_fetch_snapshot(client)
+        except FermaxAuthError as err:
+            LOGGER.error("Authentication failed during setup: %s", err)
+            return False
+        except FermaxConnectionError as err:
+            raise ConfigEntryNotReady(f"Fermax cloud unreachable: {err}") from err
+        await cache.async_save(data.snapshot)
+        data.ready = True
+        client.start_token_renewal()
+    else:
+        # Restore entities from the cache and connect without blocking startup
+        data.ready = client.token_valid
+        entry.async_create_background_task(
+            hass, _async_connect(hass, entry, data), f"{DOMAIN} {entry.entry_id} connect"
+        )
+
+    data.registry.async_sync(data.snapshot)
+    data.coordinator = BlueConDeviceCoordinator(hass, data)
+    entry.async_on_unload(data.coordinator.async_shutdown)
+
+    hass.data[DOMAIN].entries[entry.entry_id] = data
+
+    @callback
+    def _async_periodic_resync(_now: datetime) -> None:
+        if data.ready:
+            entry.async_create_background_task(hass, _async_resync(hass, data), f"{DOMAIN} {entry.entry_id} resync")
+
+    entry.async_on_unload(async_track_time_interval(hass, _async_periodic_resync, PAIRING_RESYNC_INTERVAL))
 
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
@@ -48,14 +129,133 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
 
     return True
 
+def _credentials(entry: ConfigEntry) -> Tuple[Optional[str], Optional[str]]:
+    """Return the credentials stored in the entry."""
+    return entry.data.get(CONF_USERNAME), entry.data.get(CONF_PASSWORD)
+
+def _hedge_policy(options: Mapping[str, Any]) -> Optional[HedgePolicy]:
+    """Return the open-door hedging policy selected in the options."""
+    if not options.get(CONF_HEDGE_OPEN_DOOR, False):
+        return None
+    # A delay of 0 ms means adaptive
+    return HedgePolicy(options.get(CONF_HEDGE_DELAY, 0) / 1000)
+
+def _host_selector(options: Mapping[str, Any]) -> HostSelector:
+    """Return the API hosts selected in the options."""
+    if options.get(CONF_ALTERNATE_HOST, False):
+        return HostSelector([*BASE_URLS, *ALTERNATE_BASE_URLS])
+    return HostSelector()
+
+async def _async_start_usage(hass: HomeAssistant, entry: ConfigEntry, data: BlueConData) -> None:
+    """Start recording unlock times and warming up ahead of them."""
+    usage = UsageTracker(hass, entry.entry_id)
+    await usage.async_load()
+    data.usage = usage
+    data.client.open_door_callback = usage.async_record
+    data.usage_task = entry.async_create_background_task(
+        hass, usage.async_run(data.client), f"{DOMAIN} {entry.entry_id} warming"
+    )
+
+async def _async_stop_usage(data: BlueConData) -> None:
+    """Stop warming up and write the recorded unlock times."""
+    if data.usage is None:
+        return
+    data.client.open_door_callback = None
+    if data.usage_task is not None:
+        data.usage_task.cancel()
+    await data.usage.async_flush()
+    data.usage = data.usage_task = None
+
+async def _async_login(client: FermaxClient, entry: ConfigEntry) -> None:
+    """Log in with the stored credentials if the token is not valid."""
+    if client.token_valid:
+        return
+    username = entry.data.get(CONF_USERNAME)
+    password = entry.data.get(CONF_PASSWORD)
+    if username and password:
+        await client.async_login(username, password)
+    else:
+        LOGGER.warning("No credentials found for re-authentication")
+
+async def _async_connect(hass: HomeAssistant, entry: ConfigEntry, data: BlueConData) -> None:
+    """Log in, mark the entry ready and revalidate stale pairings."""
+    await hass.data[DOMAIN].transport.async_stagger()
+    backoff = CONNECT_BACKOFF_MIN
+    while True:
+        try:
+            await _async_login(data.client, entry)
+            break
+        except FermaxAuthError as err:
+            LOGGER.error("Authentication failed during setup: %s", err)
+            return
+        except FermaxConnectionError as err:
+            LOGGER.warning("Fermax cloud unreachable, retrying in %ss: %s", backoff, err)
+        await asyncio.sleep(backoff)
+        backoff = min(backoff * 2, CONNECT_BACKOFF_MAX)
+
+    data.client.start_token_renewal()
+    if not data.ready:
+        data.ready = True
+        async_dispatcher_send(hass, SIGNAL_READY.format(entry.entry_id))
+
+    if data.cache.stale:
+        await _async_resync(hass, data, refetch_known=True)
+
+async def _async_resync(hass: HomeAssistant, data: BlueConData, refetch_known: bool = False) -> None:
+    """Resync pairings, keeping the cached ones if the cloud is unreachable."""
+    try:
+        await async_refresh_snapshot(hass, data, refetch_known)
+    except (FermaxError, ConfigEntryAuthFailed) as err:
+        LOGGER.warning("Could not revalidate pairings, using cached data: %s", err)
+
 async def update_listener(hass: HomeAssistant, entry: ConfigEntry):
-    """Handle options update."""
-    await hass.config_entries.async_reload(entry.entry_id)
+    """Apply changed options in place, reload only for new credentials."""
+    data: BlueConData = hass.data[DOMAIN].entries[entry.entry_id]
+    if _credentials(entry) != data.credentials:
+        await hass.config_entries.async_reload(entry.entry_id)
+        return
+
+    previous, options = data.options, dict(entry.options)
+    data.options = options
+    changed = {key for key in previous.keys() | options.keys() if previous.get(key) != options.get(key)}
+    if not changed:
+        return
+    LOGGER.debug("Applying changed options %s", sorted(changed))
+    client = data.client
+
+    if CONF_LOCK_STATE_RESET in changed:
+        for lock in data.locks.values():
+            lock.lock_timeout = options.get(CONF_LOCK_STATE_RESET, 5)
+
+    if CONF_OPEN_DOOR_COOLDOWN in changed:
+        client.open_door_cooldown = options.get(CONF_OPEN_DOOR_COOLDOWN, 0)
+
+    if changed & {CONF_HEDGE_OPEN_DOOR, CONF_HEDGE_DELAY}:
+        client.hedge = _hedge_policy(options)
+
+    if CONF_ALTERNATE_HOST in changed:
+        await client.async_set_hosts(_host_selector(options))
+
+    if CONF_DEDICATED_SESSION in changed:
+        transport: FermaxTransport = hass.data[DOMAIN].transport
+        if options.get(CONF_DEDICATED_SESSION, False):
+            client.set_session(transport.session(entry.entry_id, True), KEEPALIVE_TIMEOUT)
+            client.start_keepalive()
+        else:
+            await client.async_stop_keepalive()
+            client.set_session(transport.session(entry.entry_id, False), CONNECTION_IDLE_TIMEOUT)
+            await transport.async_release(entry.entry_id)
+
+    if CONF_PREDICTIVE_WARMING in changed:
+        if options.get(CONF_PREDICTIVE_WARMING, False):
+            await _async_start_usage(hass, entry, data)
+        else:
+            await _async_stop_usage(data)
 
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
     unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
     if unload_ok:
-        hass.data[DOMAIN].pop(entry.entry_id)
+        hass.data[DOMAIN].entries.pop(entry.entry_id)
 
     return unload_ok
@@ -0,0 +1,48 @@
+"""Device connectivity sensors for BlueCon."""
+from typing import Any, Dict
+
+from homeassistant.components.binary_sensor import BinarySensorDeviceClass, BinarySensorEntity
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import EntityCategory
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+
+from .coordinator import BlueConDeviceCoordinator
+from .entity import BlueConDeviceEntity, async_setup_device_entities
+from .registry import BlueConDevice
+
+
+async def async_setup_entry(hass: HomeAssistant, config: ConfigEntry, async_add_entities: AddEntitiesCallback) -> None:
+    """Set up the connectivity sensors."""
+    async_setup_device_entities(
+        hass,
+        config,
+        async_add_entities,
+        lambda coordinator, device: [BlueConConnectivitySensor(coordinator, device)],
+    )
+
+
+class BlueConConnectivitySensor(BlueConDeviceEntity, BinarySensorEntity):
+    """Whether the device is connected to the Fermax cloud."""
+
+    _attr_name = "Connectivity"
+    _attr_device_class = BinarySensorDeviceClass.CONNECTIVITY
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+
+    def __init__(self, coordinator: BlueConDeviceCoordinator, device: BlueConDevice) -> None:
+        """Initialize the sensor."""
+        super().__init__(coordinator, device, "connectivity")
+
+    @property
+    def is_on(self) -> bool | None:
+        """Return True if the device reports being connected."""
+        state = self.device_data.get("connectionState")
+        return None if state is None else state.lower() == "connected"
+
+    @property
+    def extra_state_attributes(self) -> Dict[str, Any]:
+        """Return the raw connection state and status."""
+        return {
+            "connection_state": self.device_data.get("connectionState"),
+            "status": self.device_data.get("status"),
+        }
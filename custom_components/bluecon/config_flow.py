@@ -6,7 +6,7 @@ from homeassistant.const import CONF_USERNAME, CONF_PASSWORD
 from homeassistant.core import callback
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
 
-from .const import DOMAIN, CONF_LOCK_STATE_RESET
+from .const import DOMAIN, CONF_ALTERNATE_HOST, CONF_DEDICATED_SESSION, CONF_HEDGE_DELAY, CONF_HEDGE_OPEN_DOOR, CONF_LOCK_STATE_RESET, CONF_OPEN_DOOR_COOLDOWN, CONF_PREDICTIVE_WARMING, DATA_FLOW_TOKENS
 from .fermax_api import FermaxClient, FermaxAuthError
 
 class BlueConConfigFlow(ConfigFlow, domain=DOMAIN):
@@ -23,6 +23,9 @@ class BlueConConfigFlow(ConfigFlow, domain=DOMAIN):
 
                 await self.async_set_unique_id(user_input[CONF_USERNAME])
                 self._abort_if_unique_id_configured()
+
+                # Hand the fresh token to setup so it does not log in again
+                self.hass.data.setdefault(DATA_FLOW_TOKENS, {})[self.unique_id] = client.token_data
                 
                 return self.async_create_entry(
                     title=user_input[CONF_USERNAME], 
@@ -60,6 +63,7 @@ class BlueConConfigFlow(ConfigFlow, domain=DOMAIN):
                 session = async_get_clientsession(self.hass)
                 client = FermaxClient(session)
                 await client.async_login(user_input[CONF_USERNAME], user_input[CONF_PASSWORD])
+                self.hass.data.setdefault(DATA_FLOW_TOKENS, {})[entry.unique_id] = client.token_data
 
                 self.hass.config_entries.async_update_entry(
                     entry=entry, 
@@ -99,9 +103,15 @@ class BlueConOptionsFlow(OptionsFlow):
         error_info: dict[str, str] = {}
 
         lockTimeout = self.config_entry.options.get(CONF_LOCK_STATE_RESET, 5)
+        openDoorCooldown = self.config_entry.options.get(CONF_OPEN_DOOR_COOLDOWN, 0)
+        dedicatedSession = self.config_entry.options.get(CONF_DEDICATED_SESSION, False)
+        predictiveWarming = self.config_entry.options.get(CONF_PREDICTIVE_WARMING, False)
+        hedgeOpenDoor = self.config_entry.options.get(CONF_HEDGE_OPEN_DOOR, False)
+        hedgeDelay = self.config_entry.options.get(CONF_HEDGE_DELAY, 0)
+        alternateHost = self.config_entry.options.get(CONF_ALTERNATE_HOST, False)
 
         if user_input is not None:
-            if user_input[CONF_LOCK_STATE_RESET] >= 0:
+            if all(user_input[key] >= 0 for key in (CONF_LOCK_STATE_RESET, CONF_OPEN_DOOR_COOLDOWN, CONF_HEDGE_DELAY)):
                 self.hass.config_entries.async_update_entry(self.config_entry, options=user_input)
                 return self.async_create_entry(title=None, data=None)
             else:
@@ -110,7 +120,13 @@ class BlueConOptionsFlow(OptionsFlow):
         return self.async_show_form(
             step_id="init", 
             data_schema=vol.Schema({
-                vol.Required(CONF_LOCK_STATE_RESET, default=lockTimeout): int
+                vol.Required(CONF_LOCK_STATE_RESET, default=lockTimeout): int,
+                vol.Required(CONF_OPEN_DOOR_COOLDOWN, default=openDoorCooldown): int,
+                vol.Required(CONF_DEDICATED_SESSION, default=dedicatedSession): bool,
+                vol.Required(CONF_PREDICTIVE_WARMING, default=predictiveWarming): bool,
+                vol.Required(CONF_HEDGE_OPEN_DOOR, default=hedgeOpenDoor): bool,
+                vol.Required(CONF_HEDGE_DELAY, default=hedgeDelay): int,
+                vol.Required(CONF_ALTERNATE_HOST, default=alternateHost): bool,
             }),
             errors=error_info
         )
@@ -1,6 +1,22 @@
 DOMAIN = "bluecon"
 
 CONF_LOCK_STATE_RESET = "lockStateReset"
+CONF_OPEN_DOOR_COOLDOWN = "openDoorCooldown"
+CONF_DEDICATED_SESSION = "dedicatedSession"
+CONF_PREDICTIVE_WARMING = "predictiveWarming"
+CONF_HEDGE_OPEN_DOOR = "hedgeOpenDoor"
+CONF_HEDGE_DELAY = "hedgeDelay"
+CONF_ALTERNATE_HOST = "alternateHost"
+
+# Tokens obtained by the config flow, keyed by unique id, consumed on setup
+DATA_FLOW_TOKENS = f"{DOMAIN}_flow_tokens"
+
+# End-to-end time budget for opening a door, token refresh included, in seconds
+OPEN_DOOR_DEADLINE = 15
 
 DEVICE_MANUFACTURER = "Fermax"
 HASS_BLUECON_VERSION = "0.7.0"
+
+# Dispatcher signals, formatted with the config entry id
+SIGNAL_READY = f"{DOMAIN}_ready_{{}}"
+SIGNAL_SNAPSHOT_UPDATED = f"{DOMAIN}_snapshot_updated_{{}}"
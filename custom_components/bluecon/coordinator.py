@@ -0,0 +1,105 @@
+"""Device health polling for BlueCon."""
+import asyncio
+from datetime import timedelta
+import logging
+from typing import Any, Dict
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.exceptions import ConfigEntryAuthFailed
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+
+from .const import DOMAIN
+from .fermax_api import FermaxError
+from .models import BlueConData
+from .sync import DEVICE_INFO_CONCURRENCY
+
+LOGGER = logging.getLogger(__name__)
+
+# Polling starts here, doubles while nothing changes and drops to the
+# minimum after an error or a state change
+DEVICE_POLL_INTERVAL = timedelta(minutes=5)
+DEVICE_POLL_INTERVAL_MIN = timedelta(minutes=1)
+DEVICE_POLL_INTERVAL_MAX = timedelta(minutes=30)
+
+# Device info fields whose change speeds up polling
+HEALTH_KEYS = ("connectionState", "status")
+# Signal levels fluctuate, only a jump of this many levels speeds up polling
+WIRELESS_SIGNAL_CHANGE = 2
+
+
+def _health_changed(old: Dict[str, Any], new: Dict[str, Any]) -> bool:
+    """Return True if a device's health changed enough to poll sooner."""
+    if any(old.get(key) != new.get(key) for key in HEALTH_KEYS):
+        return True
+    old_signal, new_signal = old.get("wirelessSignal"), new.get("wirelessSignal")
+    if isinstance(old_signal, (int, float)) and isinstance(new_signal, (int, float)):
+        return abs(new_signal - old_signal) >= WIRELESS_SIGNAL_CHANGE
+    return old_signal != new_signal
+
+
+class BlueConDeviceCoordinator(DataUpdateCoordinator[Dict[str, Dict[str, Any]]]):
+    """Poll device info for every device of an account in one cycle."""
+
+    def __init__(self, hass: HomeAssistant, data: BlueConData) -> None:
+        """Initialize the coordinator with the device info from discovery."""
+        super().__init__(
+            hass,
+            LOGGER,
+            name=f"{DOMAIN} {data.entry_id} devices",
+            update_interval=DEVICE_POLL_INTERVAL,
+        )
+        self._data = data
+        self.data = dict(data.snapshot["devices"])
+
+    @callback
+    def async_add_devices(self, devices: Dict[str, Dict[str, Any]]) -> None:
+        """Start tracking newly paired devices with the info from discovery."""
+        for device_id, info in devices.items():
+            self.data.setdefault(device_id, info)
+
+    async def _async_update_data(self) -> Dict[str, Dict[str, Any]]:
+        """Fetch device info for all devices and adapt the polling interval."""
+        if not self._data.ready:
+            self.update_interval = DEVICE_POLL_INTERVAL_MIN
+            raise UpdateFailed("Not logged in to the Fermax cloud yet")
+
+        previous = self.data or {}
+        device_ids = list(self._data.snapshot["devices"])
+        # Same cap as discovery, so a large account cannot fill the rate limiter
+        semaphore = asyncio.Semaphore(DEVICE_INFO_CONCURRENCY)
+
+        async def _async_get_device_info(device_id: str) -> Dict[str, Any]:
+            async with semaphore:
+                return await self._data.client.async_get_device_info(device_id)
+
+        results = await asyncio.gather(
+            *(_async_get_device_info(device_id) for device_id in device_ids),
+            return_exceptions=True,
+        )
+
+        devices: Dict[str, Dict[str, Any]] = {}
+        errors = 0
+        for device_id, result in zip(device_ids, results):
+            if isinstance(result, FermaxError):
+                LOGGER.debug("Could not poll device %s: %s", device_id, result)
+                errors += 1
+                devices[device_id] = previous.get(device_id, {})
+            elif isinstance(result, ConfigEntryAuthFailed):
+                # There is no reauth flow, report it like any failed poll
+                raise UpdateFailed(f"Authentication failed: {result}") from result
+            elif isinstance(result, BaseException):
+                raise result
+            else:
+                devices[device_id] = result
+
+        if device_ids and errors == len(device_ids):
+            self.update_interval = DEVICE_POLL_INTERVAL_MIN
+            raise UpdateFailed(f"Could not poll any of {errors} devices")
+
+        changed = any(_health_changed(previous.get(device_id, {}), info) for device_id, info in devices.items())
+        if errors or changed:
+            self.update_interval = DEVICE_POLL_INTERVAL_MIN
+        else:
+            self.update_interval = min(self.update_interval * 2, DEVICE_POLL_INTERVAL_MAX)
+        LOGGER.debug("Polled %s devices (%s failed), next poll in %s", len(device_ids), errors, self.update_interval)
+        return devices
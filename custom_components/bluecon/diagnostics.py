@@ -0,0 +1,30 @@
+"""Diagnostics support for BlueCon."""
+from typing import Any, Dict
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import CONF_PASSWORD, CONF_USERNAME
+from homeassistant.core import HomeAssistant
+
+from .const import DOMAIN
+from .models import BlueConDomainData
+
+TO_REDACT = {CONF_USERNAME, CONF_PASSWORD}
+
+
+async def async_get_config_entry_diagnostics(hass: HomeAssistant, entry: ConfigEntry) -> Dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    domain_data: BlueConDomainData = hass.data[DOMAIN]
+    data = domain_data.entries[entry.entry_id]
+    return {
+        "entry": {
+            "data": async_redact_data(entry.data, TO_REDACT),
+            "options": dict(entry.options),
+        },
+        "ready": data.ready,
+        "locks": len(data.locks),
+        "client": data.client.diagnostics,
+        "device_poll_interval": data.coordinator.update_interval.total_seconds(),
+        "usage": data.usage.metrics if data.usage else None,
+        "transport": domain_data.transport.as_dict(),
+    }
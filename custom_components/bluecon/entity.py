@@ -0,0 +1,67 @@
+"""Base entity for BlueCon device health."""
+from typing import Any, Callable, Dict, Iterable
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
+from homeassistant.helpers.entity import Entity
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
+
+from .const import DOMAIN, SIGNAL_SNAPSHOT_UPDATED
+from .coordinator import BlueConDeviceCoordinator
+from .models import BlueConData
+from .registry import BlueConDevice, RegistryChanges
+
+
+class BlueConDeviceEntity(CoordinatorEntity[BlueConDeviceCoordinator]):
+    """Entity reporting polled device info, attached to the device's locks."""
+
+    _attr_has_entity_name = True
+
+    def __init__(self, coordinator: BlueConDeviceCoordinator, device: BlueConDevice, key: str) -> None:
+        """Initialize the entity."""
+        super().__init__(coordinator)
+        self.device_id = device.device_id
+        self._attr_unique_id = f"{device.device_id}_{key}".lower()
+        self._attr_device_info = device.device_info
+
+    @property
+    def device_data(self) -> Dict[str, Any]:
+        """Return the latest device info."""
+        return self.coordinator.data.get(self.device_id, {})
+
+    @property
+    def available(self) -> bool:
+        """Return False if the device is gone or polling failed."""
+        return super().available and self.device_id in self.coordinator.data
+
+
+def async_setup_device_entities(
+    hass: HomeAssistant,
+    config: ConfigEntry,
+    async_add_entities: AddEntitiesCallback,
+    factory: Callable[[BlueConDeviceCoordinator, BlueConDevice], Iterable[Entity]],
+) -> None:
+    """Add entities for every device, and for devices paired later."""
+    data: BlueConData = hass.data[DOMAIN].entries[config.entry_id]
+    devices = data.registry.devices
+    known = set(devices)
+    async_add_entities(
+        entity for device_id in known for entity in factory(data.coordinator, devices[device_id])
+    )
+
+    @callback
+    def _async_snapshot_updated(changes: RegistryChanges) -> None:
+        devices = data.registry.devices
+        known.difference_update(changes.devices_removed)
+        added = devices.keys() - known
+        known.update(added)
+        if added:
+            async_add_entities(
+                entity for device_id in added for entity in factory(data.coordinator, devices[device_id])
+            )
+
+    config.async_on_unload(
+        async_dispatcher_connect(hass, SIGNAL_SNAPSHOT_UPDATED.format(config.entry_id), _async_snapshot_updated)
+    )
@@ -1,19 +1,107 @@
 """Fermax Blue API Client."""
+import asyncio
+import collections
+import contextlib
+import contextvars
+import email.utils
+import heapq
+import itertools
 import logging
 import json
+import math
 import datetime
-from typing import Optional, List, Dict, Any, Callable
+import random
+import time
+from typing import Optional, List, Dict, Any, AsyncIterator, Awaitable, Callable, Collection, Deque, Hashable, Tuple
 import aiohttp
+from yarl import URL
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
 from homeassistant.exceptions import HomeAssistantError, ConfigEntryAuthFailed
+from homeassistant.util.ssl import get_default_context
 
 LOGGER = logging.getLogger(__name__)
 
 BASE_URL = "https://pro-duoxme.fermax.io"
 AUTH_URL = "https://oauth-pro-duoxme.fermax.io/oauth/token"
 
+# Candidate API hosts, in order of preference
+BASE_URLS = [BASE_URL]
+# Extra hosts tried only when enabled; not known to serve every API path
+ALTERNATE_BASE_URLS = ["https://blue.fermax.io"]
+
+# Background renewal: refresh this many seconds before the token expires
+TOKEN_RENEW_SKEW = 300
+TOKEN_RENEW_BACKOFF_MIN = 5
+TOKEN_RENEW_BACKOFF_MAX = 300
+
+# Per-endpoint request timeouts, in seconds
+REQUEST_TIMEOUTS = {
+    "auth": 15,
+    "pairings": 20,
+    "device_info": 15,
+    "open_door": 10,
+    "f1": 10,
+}
+
+# Retries for idempotent requests, with full-jitter exponential backoff
+REQUEST_RETRIES = 2
+REQUEST_RETRY_BACKOFF = 0.5
+REQUEST_RETRY_BACKOFF_MAX = 5
+
+# Circuit breaker: open after this many consecutive failures, probe after the reset timeout
+BREAKER_FAILURE_THRESHOLD = 5
+BREAKER_RESET_TIMEOUT = 30
+
+# Client-side rate limit per account: sustained requests per second and burst size
+RATE_LIMIT = 5
+RATE_LIMIT_BURST = 20
+# Longest a request waits in the rate limit queue before failing
+RATE_LIMIT_MAX_WAIT = 30
+
+# Concurrent requests per account; queued requests are served by priority
+REQUEST_SLOTS = 4
+# Request priorities, lower is served first by the limiter and the scheduler
+PRIORITY_INTERACTIVE = 0
+PRIORITY_BACKGROUND = 1
+
+# Host scoring: weight of a new latency/error sample
+HOST_EWMA_ALPHA = 0.3
+# Seconds added to a host's score at a 100% error rate
+HOST_ERROR_PENALTY = 5
+# Latency assumed for a host that has not been measured yet
+HOST_DEFAULT_LATENCY = 1.0
+# Only move traffic to a host that scores this many times better
+HOST_SWITCH_RATIO = 2
+# Re-probe the idle candidate hosts this often
+HOST_PROBE_INTERVAL = 300
+# Answers that mean a non-primary host does not serve the API path
+HOST_REJECT_STATUSES = frozenset({401, 403, 404})
+
+PAIRINGS_PATH = "/pairing/api/v3/pairings/me"
+
+# Hedged open door: delay used until enough latencies are recorded
+HEDGE_DEFAULT_DELAY = 1.0
+# Adaptive hedge delay: this percentile of the last HEDGE_SAMPLES latencies
+HEDGE_PERCENTILE = 0.95
+HEDGE_SAMPLES = 50
+HEDGE_MIN_SAMPLES = 10
+
+# Dedicated session: connection pool tuned for the two Fermax hosts
+CONNECTION_LIMIT = 10
+DNS_CACHE_TTL = 300
+KEEPALIVE_TIMEOUT = 75
+# Ping the hosts this often so pooled TLS connections stay open
+KEEPALIVE_INTERVAL = 45
+# aiohttp closes idle pooled connections after this long by default
+CONNECTION_IDLE_TIMEOUT = 15
+
 # Basic Auth Header for Fermax App
 # "dpv7iqz6ee5mazm1iq9dw1d42slyut48kj0mp5fvo58j5ih:c7ylkqpujwah85yhnprv0wdvyzutlcnkw4sz90buldbulk1" base64 encoded
 CLIENT_ID_SECRET_B64 = "ZHB2N2lxejZlZTVtYXptMWlxOWR3MWQ0MnNseXV0NDhrajBtcDVmdm81OGo1aWg6Yzd5bGtxcHVqd2FoODV5aG5wcnYwd2R2eXp1dGxjbmt3NHN6OTBidWxkYnVsazE="
@@ -27,6 +115,19 @@ COMMON_HEADERS = {
     "app-build": "3",
 }
 
+# Endpoints whose response body is JSON, others are only checked for errors
+JSON_ENDPOINTS = frozenset({"pairings", "device_info"})
+
+if orjson is not None:
+    _json_dumps: Callable[[Any], bytes] = orjson.dumps
+    _json_loads: Callable[[bytes], Any] = orjson.loads
+else:
+    def _json_dumps(data: Any) -> bytes:
+        """Encode a request body."""
+        return json.dumps(data, separators=(",", ":")).encode()
+
+    _json_loads = json.loads
+
 class FermaxError(HomeAssistantError):
     """Base error for Fermax."""
 
@@ -36,6 +137,520 @@ class FermaxAuthError(FermaxError):
 class FermaxConnectionError(FermaxError):
     """Connection error."""
 
+class FermaxUnavailableError(FermaxConnectionError):
+    """Fermax cloud unreachable, timing out or failing with a server error."""
+
+class FermaxRateLimitError(FermaxConnectionError):
+    """Request throttled, by the Fermax cloud or the client-side limiter."""
+
+class FermaxTimeoutError(FermaxConnectionError):
+    """Operation did not finish within its deadline."""
+
+class _TokenRejected(Exception):
+    """The API answered 401 to the current token."""
+
+class _HostRejected(FermaxUnavailableError):
+    """A non-primary host answered like it does not serve the API path."""
+
+class Deadline:
+    """Time budget shared by every step of one operation."""
+
+    def __init__(self, name: str, timeout: float) -> None:
+        """Initialize the deadline."""
+        self.name = name
+        self.timeout = timeout
+        self.started_at = time.monotonic()
+        self.expires_at = self.started_at + timeout
+        self.steps: List[Tuple[str, float]] = []
+
+    def remaining(self) -> float:
+        """Return the seconds left."""
+        return self.expires_at - time.monotonic()
+
+    def summary(self) -> str:
+        """Return the timing breakdown of the finished steps."""
+        return ", ".join(f"{step} {elapsed:.3f}s" for step, elapsed in self.steps) or "no step finished"
+
+_DEADLINE: contextvars.ContextVar[Optional[Deadline]] = contextvars.ContextVar(f"{__name__}.deadline", default=None)
+
+@contextlib.asynccontextmanager
+async def async_deadline(name: str, timeout: float) -> AsyncIterator[Deadline]:
+    """Bound every request, refresh and retry awaited inside to `timeout` seconds.
+
+    Raises FermaxTimeoutError once the budget is spent and logs how the
+    time was used.
+    """
+    outer = _DEADLINE.get()
+    if outer is not None:
+        timeout = min(timeout, outer.remaining())
+    deadline = Deadline(name, timeout)
+    token = _DEADLINE.set(deadline)
+    try:
+        async with asyncio.timeout(timeout):
+            yield deadline
+    except TimeoutError as err:
+        raise FermaxTimeoutError(f"{name} did not finish within {timeout:.1f}s") from err
+    finally:
+        _DEADLINE.reset(token)
+        LOGGER.debug("%s took %.3fs: %s", name, time.monotonic() - deadline.started_at, deadline.summary())
+
+def _record_step(step: str, start: float) -> None:
+    """Add a step to the timing breakdown of the current deadline."""
+    deadline = _DEADLINE.get()
+    if deadline is not None:
+        deadline.steps.append((step, time.monotonic() - start))
+
+def _raise_if_expired(err: BaseException) -> None:
+    """Raise FermaxTimeoutError if `err` was caused by the current deadline running out."""
+    deadline = _DEADLINE.get()
+    if deadline is not None and deadline.remaining() <= 0:
+        raise FermaxTimeoutError(f"{deadline.name} did not finish within {deadline.timeout:.1f}s") from err
+
+class RateLimiter:
+    """Token bucket shared by all requests of an account.
+
+    Requests that find the bucket empty wait their turn up to `max_wait`
+    seconds, interactive ones ahead of background ones and FIFO within a
+    priority. A Retry-After from the server pauses the whole bucket.
+    """
+
+    def __init__(self, rate: float = RATE_LIMIT, burst: int = RATE_LIMIT_BURST, max_wait: float = RATE_LIMIT_MAX_WAIT):
+        """Initialize the limiter."""
+        self._rate = rate
+        self._burst = burst
+        self._max_wait = max_wait
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        self._queue: List[tuple] = []
+        self._head: Optional[tuple] = None
+        self._seq = itertools.count()
+        self.waiting = 0
+        self.throttled = 0
+        self.total_wait = 0.0
+
+    async def async_acquire(self, priority: int = PRIORITY_BACKGROUND) -> None:
+        """Wait for a token, raising FermaxRateLimitError if the wait is too long."""
+        start = time.monotonic()
+        entry = (priority, next(self._seq), asyncio.Event())
+        heapq.heappush(self._queue, entry)
+        self._wake_head()
+        self.waiting += 1
+        try:
+            while True:
+                # Only the head of the queue waits for the bucket, the others for their turn
+                entry[2].clear()
+                now = time.monotonic()
+                budget = start + self._max_wait - now
+                if self._queue[0] is entry:
+                    self._tokens = min(self._burst, self._tokens + (now - self._updated) * self._rate)
+                    self._updated = now
+                    delay = self._paused_until - now
+                    if delay <= 0:
+                        if self._tokens >= 1:
+                            self._tokens -= 1
+                            return
+                        delay = (1 - self._tokens) / self._rate
+                    if delay > budget:
+                        raise FermaxRateLimitError(f"Rate limited, next slot in {delay:.1f}s")
+                elif budget > 0:
+                    delay = budget
+                else:
+                    raise FermaxRateLimitError(f"Rate limited, still queued after {self._max_wait}s")
+                with contextlib.suppress(asyncio.TimeoutError):
+                    await asyncio.wait_for(entry[2].wait(), delay)
+        finally:
+            self._queue.remove(entry)
+            heapq.heapify(self._queue)
+            self._wake_head()
+            self.waiting -= 1
+            self.total_wait += time.monotonic() - start
+
+    def _wake_head(self) -> None:
+        """Let the old and the new head of the queue re-check their turn."""
+        head = self._queue[0] if self._queue else None
+        if head is not self._head:
+            if self._head is not None:
+                self._head[2].set()
+            if head is not None:
+                head[2].set()
+            self._head = head
+
+    def pause(self, seconds: float) -> None:
+        """Hold all requests for the given time, as asked by Retry-After."""
+        self.throttled += 1
+        self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Return the limiter state for diagnostics."""
+        return {
+            "tokens": round(self._tokens, 2),
+            "waiting": self.waiting,
+            "throttled": self.throttled,
+            "total_wait": round(self.total_wait, 3),
+        }
+
+class RequestScheduler:
+    """Bounded in-flight slots handed out by priority.
+
+    Interactive actions (door open, F1) are served before discovery and
+    housekeeping traffic waiting for a slot; within a class, FIFO.
+    """
+
+    INTERACTIVE = PRIORITY_INTERACTIVE
+    BACKGROUND = PRIORITY_BACKGROUND
+
+    ENDPOINT_PRIORITY = {
+        "open_door": INTERACTIVE,
+        "f1": INTERACTIVE,
+    }
+
+    def __init__(self, slots: int = REQUEST_SLOTS):
+        """Initialize the scheduler."""
+        self._slots = slots
+        self._in_flight = 0
+        self._queue: List[tuple] = []
+        self._seq = itertools.count()
+        self._queued = {self.INTERACTIVE: 0, self.BACKGROUND: 0}
+        self._dispatched = {self.INTERACTIVE: 0, self.BACKGROUND: 0}
+        self._wait = {self.INTERACTIVE: 0.0, self.BACKGROUND: 0.0}
+        self.max_queue_depth = 0
+
+    @contextlib.asynccontextmanager
+    async def async_slot(self, endpoint: str):
+        """Hold an in-flight slot for a request to the given endpoint."""
+        priority = self.ENDPOINT_PRIORITY.get(endpoint, self.BACKGROUND)
+        start = time.monotonic()
+        await self._async_acquire(priority)
+        self._dispatched[priority] += 1
+        self._wait[priority] += time.monotonic() - start
+        try:
+            yield
+        finally:
+            self._release()
+
+    async def _async_acquire(self, priority: int) -> None:
+        """Wait for a free slot."""
+        if self._in_flight < self._slots and not self._queue:
+            self._in_flight += 1
+            return
+
+        future = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._queue, (priority, next(self._seq), future))
+        self._queued[priority] += 1
+        self.max_queue_depth = max(self.max_queue_depth, len(self._queue))
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                # The slot was handed over just before the cancellation
+                self._release()
+            raise
+        finally:
+            self._queued[priority] -= 1
+
+    def _release(self) -> None:
+        """Hand the slot to the next waiter, or free it."""
+        while self._queue:
+            _, _, future = heapq.heappop(self._queue)
+            if not future.done():
+                future.set_result(None)
+                return
+        self._in_flight -= 1
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Return the scheduler state for diagnostics."""
+        return {
+            "slots": self._slots,
+            "in_flight": self._in_flight,
+            "queued_interactive": self._queued[self.INTERACTIVE],
+            "queued_background": self._queued[self.BACKGROUND],
+            "max_queue_depth": self.max_queue_depth,
+            "dispatched_interactive": self._dispatched[self.INTERACTIVE],
+            "dispatched_background": self._dispatched[self.BACKGROUND],
+            "wait_interactive": round(self._wait[self.INTERACTIVE], 3),
+            "wait_background": round(self._wait[self.BACKGROUND], 3),
+        }
+
+class CircuitBreaker:
+    """Fail fast while the Fermax cloud is unhealthy.
+
+    Opens after `failure_threshold` consecutive failures. Once `reset_timeout`
+    has passed a single probe request is let through (half-open); its outcome
+    closes the breaker or opens it again.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, failure_threshold: int = BREAKER_FAILURE_THRESHOLD, reset_timeout: float = BREAKER_RESET_TIMEOUT):
+        """Initialize the breaker."""
+        self._failure_threshold = failure_threshold
+        self._reset_timeout = reset_timeout
+        self.state = self.CLOSED
+        self.failures = 0
+        self.trips = 0
+        self._opened_at = 0.0
+        self._probing = False
+
+    def before_request(self) -> None:
+        """Raise if requests should not be sent right now."""
+        if self.state == self.OPEN:
+            if time.monotonic() - self._opened_at < self._reset_timeout:
+                raise FermaxConnectionError("Fermax cloud unavailable, not sending request")
+            self.state = self.HALF_OPEN
+        if self.state == self.HALF_OPEN:
+            if self._probing:
+                raise FermaxConnectionError("Fermax cloud unavailable, recovery probe in progress")
+            self._probing = True
+
+    def record_success(self) -> None:
+        """Record a request that reached a healthy backend."""
+        if self.state != self.CLOSED:
+            LOGGER.info("Fermax cloud recovered")
+        self.state = self.CLOSED
+        self.failures = 0
+        self._probing = False
+
+    def record_failure(self) -> None:
+        """Record a failed request."""
+        self.failures += 1
+        self._probing = False
+        if self.state == self.HALF_OPEN or self.failures >= self._failure_threshold:
+            if self.state != self.OPEN:
+                LOGGER.warning("Fermax cloud unhealthy after %s failures, failing fast for %ss", self.failures, self._reset_timeout)
+                self.trips += 1
+            self.state = self.OPEN
+            self._opened_at = time.monotonic()
+
+    def release(self) -> None:
+        """Release a probe whose request ended without an outcome."""
+        self._probing = False
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Return the breaker state for diagnostics."""
+        return {
+            "state": self.state,
+            "consecutive_failures": self.failures,
+            "trips": self.trips,
+        }
+
+class HostSelector:
+    """Pick the healthiest of several candidate API hosts.
+
+    Each host keeps an EWMA of its latency and error rate. Traffic stays on
+    the active host until another one scores `switch_ratio` times better, so
+    it does not flap between hosts of similar quality.
+    """
+
+    def __init__(self, base_urls: Optional[List[str]] = None, alpha: float = HOST_EWMA_ALPHA, switch_ratio: float = HOST_SWITCH_RATIO):
+        """Initialize the selector."""
+        self.urls = list(base_urls or BASE_URLS)
+        self._alpha = alpha
+        self._switch_ratio = switch_ratio
+        self._latency: Dict[str, Optional[float]] = dict.fromkeys(self.urls)
+        self._errors: Dict[str, float] = dict.fromkeys(self.urls, 0.0)
+        self.active = self.urls[0]
+        self.switches = 0
+
+    @property
+    def primary(self) -> str:
+        """Return the preferred host, the one known to serve the full API."""
+        return self.urls[0]
+
+    def score(self, url: str) -> float:
+        """Return the host score in seconds, lower is better."""
+        latency = self._latency[url]
+        if latency is None:
+            latency = HOST_DEFAULT_LATENCY
+        return latency + HOST_ERROR_PENALTY * self._errors[url]
+
+    def select(self, exclude: Collection[str] = ()) -> str:
+        """Return the host to use, avoiding hosts that already failed."""
+        if self.active not in exclude:
+            return self.active
+        candidates = [url for url in self.urls if url not in exclude] or self.urls
+        return min(candidates, key=self.score)
+
+    def record(self, url: str, latency: float, ok: bool) -> None:
+        """Record the outcome of a request to a host."""
+        if url not in self._errors:
+            return
+        if ok:
+            previous = self._latency[url]
+            self._latency[url] = latency if previous is None else previous + self._alpha * (latency - previous)
+        self._errors[url] += self._alpha * ((0.0 if ok else 1.0) - self._errors[url])
+
+        best = min(self.urls, key=self.score)
+        if best != self.active and self.score(best) * self._switch_ratio < self.score(self.active):
+            LOGGER.info("Switching Fermax API host from %s to %s", self.active, best)
+            self.active = best
+            self.switches += 1
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Return host scores for diagnostics."""
+        return {
+            "active": self.active,
+            "switches": self.switches,
+            "hosts": {
+                url: {
+                    "latency": None if self._latency[url] is None else round(self._latency[url], 3),
+                    "error_rate": round(self._errors[url], 3),
+                }
+                for url in self.urls
+            },
+        }
+
+class HedgePolicy:
+    """Decide when to send a backup request and count how hedges fare.
+
+    With a fixed `delay` the backup is sent after that many seconds,
+    otherwise after the `percentile` of recent latencies.
+    """
+
+    def __init__(self, delay: Optional[float] = None, percentile: float = HEDGE_PERCENTILE, samples: int = HEDGE_SAMPLES):
+        """Initialize the policy."""
+        self._delay = delay
+        self._percentile = percentile
+        self._latencies: Deque[float] = collections.deque(maxlen=samples)
+        self.requests = 0
+        self.fired = 0
+        self.won = 0
+
+    @property
+    def delay(self) -> float:
+        """Return seconds to wait before hedging."""
+        if self._delay:
+            return self._delay
+        if len(self._latencies) < HEDGE_MIN_SAMPLES:
+            return HEDGE_DEFAULT_DELAY
+        latencies = sorted(self._latencies)
+        return latencies[int(self._percentile * (len(latencies) - 1))]
+
+    def record(self, latency: float) -> None:
+        """Record the latency of a completed request."""
+        self._latencies.append(latency)
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Return hedging counters for diagnostics."""
+        return {
+            "delay": round(self.delay, 3),
+            "requests": self.requests,
+            "hedges_fired": self.fired,
+            "hedges_won": self.won,
+        }
+
+class TokenState:
+    """OAuth token parsed once, with a monotonic expiry deadline.
+
+    The deadline is immune to wall-clock steps; expires_at is only kept for
+    persistence in the same format as before.
+    """
+
+    __slots__ = ("access_token", "refresh_token", "token_type", "expires_at", "_deadline")
+
+    def __init__(
+        self,
+        access_token: str,
+        refresh_token: Optional[str],
+        token_type: str,
+        expires_at: Optional[datetime.datetime],
+        deadline: float,
+    ):
+        """Initialize the token state."""
+        self.access_token = access_token
+        self.refresh_token = refresh_token
+        self.token_type = token_type
+        self.expires_at = expires_at
+        self._deadline = deadline
+
+    @classmethod
+    def from_response(
+        cls, data: Dict[str, Any], previous: Optional["TokenState"] = None
+    ) -> "TokenState":
+        """Build the state from an OAuth token response."""
+        expires_in = data.get("expires_in", 3600)
+        expires_at = datetime.datetime.now(datetime.timezone.utc) + datetime.timedelta(seconds=expires_in)
+        return cls(
+            data["access_token"],
+            data.get("refresh_token", previous.refresh_token if previous else None),
+            data.get("token_type", "Bearer"),
+            expires_at,
+            time.monotonic() + expires_in,
+        )
+
+    @classmethod
+    def from_dict(cls, data: Optional[Dict[str, Any]]) -> Optional["TokenState"]:
+        """Build the state from persisted token data."""
+        if not data:
+            return None
+
+        # Handle ISO string or datetime object
+        expires_at = data.get("expires_at")
+        if isinstance(expires_at, str):
+            try:
+                expires_at = datetime.datetime.fromisoformat(expires_at)
+            except ValueError:
+                expires_at = None
+        if not isinstance(expires_at, datetime.datetime):
+            expires_at = None
+        elif expires_at.tzinfo is None:
+            expires_at = expires_at.replace(tzinfo=datetime.timezone.utc)
+
+        if expires_at is None:
+            # Unknown expiry, treat as expired but keep the refresh token
+            deadline = float("-inf")
+        else:
+            remaining = (expires_at - datetime.datetime.now(datetime.timezone.utc)).total_seconds()
+            deadline = time.monotonic() + remaining
+
+        return cls(
+            data.get("access_token", ""),
+            data.get("refresh_token"),
+            data.get("token_type", "Bearer"),
+            expires_at,
+            deadline,
+        )
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Return the token in its persisted format."""
+        return {
+            "access_token": self.access_token,
+            "refresh_token": self.refresh_token,
+            "expires_at": self.expires_at.isoformat() if self.expires_at else None,
+            "token_type": self.token_type,
+        }
+
+    @property
+    def valid(self) -> bool:
+        """Return True if the token has not expired."""
+        return time.monotonic() < self._deadline
+
+    def expires_in(self) -> float:
+        """Return seconds until the token expires (negative once expired)."""
+        return self._deadline - time.monotonic()
+
+
+def open_door_payload(access_id: Dict[str, int]) -> bytes:
+    """Return the request body that opens the door with the given access id."""
+    return _json_dumps(access_id)
+
+
+def create_session() -> aiohttp.ClientSession:
+    """Create a session with a connection pool tuned for the Fermax hosts.
+
+    The caller owns the session and must close it.
+    """
+    connector = aiohttp.TCPConnector(
+        limit=CONNECTION_LIMIT,
+        ttl_dns_cache=DNS_CACHE_TTL,
+        keepalive_timeout=KEEPALIVE_TIMEOUT,
+        ssl=get_default_context(),
+    )
+    return aiohttp.ClientSession(connector=connector)
+
+
 class FermaxClient:
     """Fermax Blue API Client."""
 
@@ -43,34 +658,271 @@ class FermaxClient:
         self, 
         session: aiohttp.ClientSession, 
         token_data: Optional[Dict[str, Any]] = None,
-        save_token_callback: Optional[Callable[[Dict[str, Any]], Any]] = None
+        save_token_callback: Optional[Callable[[Dict[str, Any]], Any]] = None,
+        renew_skew: int = TOKEN_RENEW_SKEW,
+        open_door_cooldown: float = 0,
+        timeouts: Optional[Dict[str, float]] = None,
+        max_retries: int = REQUEST_RETRIES,
+        breaker: Optional[CircuitBreaker] = None,
+        limiter: Optional[RateLimiter] = None,
+        scheduler: Optional[RequestScheduler] = None,
+        hosts: Optional[HostSelector] = None,
+        hedge: Optional[HedgePolicy] = None,
+        keepalive_timeout: float = CONNECTION_IDLE_TIMEOUT,
+        open_door_callback: Optional[Callable[[str, Dict[str, int], bool], Any]] = None,
     ):
         """Initialize the client."""
         self._session = session
-        self._token_data = token_data
+        self._timeouts = {
+            endpoint: aiohttp.ClientTimeout(total=timeout)
+            for endpoint, timeout in {**REQUEST_TIMEOUTS, **(timeouts or {})}.items()
+        }
+        self._max_retries = max_retries
+        self._breaker = breaker or CircuitBreaker()
+        self._limiter = limiter or RateLimiter()
+        self._scheduler = scheduler or RequestScheduler()
+        self._hosts = hosts or HostSelector()
+        self._hedge = hedge
+        self._token = TokenState.from_dict(token_data)
         self._save_token_callback = save_token_callback
+        self._renew_skew = renew_skew
+        self._open_door_cooldown = open_door_cooldown
+        self._inflight: Dict[Hashable, asyncio.Task] = {}
+        self._door_opened_at: Dict[Hashable, float] = {}
+        self._tasks: Dict[str, asyncio.Task] = {}
+        self._token_changed = asyncio.Event()
+        self._keepalive_timeout = keepalive_timeout
+        self._last_activity = -math.inf
+        self._open_door_callback = open_door_callback
+        self._headers: Dict[str, str] = {}
+        self._headers_token: Optional[TokenState] = None
+        self._urls: Dict[Tuple[str, str], URL] = {}
+
+    @property
+    def token_data(self) -> Optional[Dict[str, Any]]:
+        """Return the token in its persisted format."""
+        return self._token.as_dict() if self._token else None
 
     @property
     def token_valid(self) -> bool:
         """Check if token is present and not expired."""
-        if not self._token_data:
-            return False
-        
-        expires_at = self._token_data.get("expires_at")
-        if not expires_at:
-            return False
-            
-        # Handle ISO string or datetime object
-        if isinstance(expires_at, str):
+        return self._token is not None and self._token.valid
+
+    @property
+    def keepalive_timeout(self) -> float:
+        """Return how long the session keeps idle connections open."""
+        return self._keepalive_timeout
+
+    @property
+    def open_door_cooldown(self) -> float:
+        """Return seconds during which repeated opens of a door are absorbed."""
+        return self._open_door_cooldown
+
+    @open_door_cooldown.setter
+    def open_door_cooldown(self, value: float) -> None:
+        self._open_door_cooldown = value
+
+    @property
+    def hedge(self) -> Optional[HedgePolicy]:
+        """Return the open-door hedging policy, None if disabled."""
+        return self._hedge
+
+    @hedge.setter
+    def hedge(self, value: Optional[HedgePolicy]) -> None:
+        self._hedge = value
+
+    @property
+    def open_door_callback(self) -> Optional[Callable[[str, Dict[str, int], bool], Any]]:
+        """Return the callback told about every open-door request sent."""
+        return self._open_door_callback
+
+    @open_door_callback.setter
+    def open_door_callback(self, value: Optional[Callable[[str, Dict[str, int], bool], Any]]) -> None:
+        self._open_door_callback = value
+
+    @property
+    def hosts(self) -> HostSelector:
+        """Return the API host selector."""
+        return self._hosts
+
+    async def async_set_hosts(self, hosts: HostSelector) -> None:
+        """Route future requests through another set of API hosts."""
+        await self._async_stop_task("host_probing")
+        self._hosts = hosts
+        self.start_host_probing()
+
+    def set_session(self, session: aiohttp.ClientSession, keepalive_timeout: float = CONNECTION_IDLE_TIMEOUT) -> None:
+        """Send future requests through another session."""
+        self._session = session
+        self._keepalive_timeout = keepalive_timeout
+        self._last_activity = -math.inf
+
+    @property
+    def warm(self) -> bool:
+        """Return True if a request would need neither a token refresh nor a new connection."""
+        return self.token_valid and time.monotonic() - self._last_activity < self._keepalive_timeout
+
+    @property
+    def diagnostics(self) -> Dict[str, Any]:
+        """Return client state for diagnostics."""
+        return {
+            "token_valid": self.token_valid,
+            "token_expires_in": round(self._token.expires_in()) if self._token else None,
+            "circuit_breaker": self._breaker.as_dict(),
+            "rate_limiter": self._limiter.as_dict(),
+            "scheduler": self._scheduler.as_dict(),
+            "hosts": self._hosts.as_dict(),
+            "hedging": self._hedge.as_dict() if self._hedge else None,
+        }
+
+    def start_token_renewal(self) -> None:
+        """Start renewing the token in the background ahead of its expiry."""
+        self._start_task("token_renewal", self._async_renew_token_loop)
+
+    def start_keepalive(self, interval: float = KEEPALIVE_INTERVAL) -> None:
+        """Open connections to the Fermax hosts now and keep them open."""
+        self._start_task("keepalive", lambda: self._async_keepalive_loop(interval))
+
+    def start_host_probing(self, interval: float = HOST_PROBE_INTERVAL) -> None:
+        """Periodically measure the idle candidate hosts so a recovered one can win back traffic."""
+        if len(self._hosts.urls) > 1:
+            self._start_task("host_probing", lambda: self._async_probe_hosts_loop(interval))
+
+    async def _async_probe_hosts_loop(self, interval: float) -> None:
+        """Probe the hosts not currently in use until cancelled."""
+        while True:
+            await asyncio.sleep(interval)
+            await asyncio.gather(
+                *(self._async_probe_host(url) for url in self._hosts.urls if url != self._hosts.active)
+            )
+
+    async def async_stop_keepalive(self) -> None:
+        """Stop keeping connections open."""
+        await self._async_stop_task("keepalive")
+
+    async def _async_stop_task(self, name: str) -> None:
+        """Cancel a named background task and wait for it to end."""
+        task = self._tasks.pop(name, None)
+        if task is not None:
+            task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
+
+    def _start_task(self, name: str, factory: Callable[[], Awaitable[None]]) -> None:
+        """Start a named background task unless it is already running."""
+        if name not in self._tasks:
+            self._tasks[name] = asyncio.get_running_loop().create_task(factory())
+
+    async def async_stop(self) -> None:
+        """Cancel background work."""
+        tasks, self._tasks = self._tasks, {}
+        for task in tasks.values():
+            task.cancel()
+        for task in tasks.values():
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
+
+    async def _async_keepalive_loop(self, interval: float) -> None:
+        """Send lightweight requests so pooled connections stay warm."""
+        while True:
+            await self.async_warm_connections()
+            await asyncio.sleep(interval)
+
+    async def async_warm_connections(self) -> None:
+        """Open (or reuse) a connection to each Fermax host."""
+        await asyncio.gather(
+            *(self._async_ping(url) for url in (self._hosts.select(), AUTH_URL))
+        )
+
+    async def async_warm(self, horizon: float) -> None:
+        """Prepare for requests expected within `horizon` seconds.
+
+        Renews a token that would expire in that window and opens
+        connections to the Fermax hosts.
+        """
+        if self._token is not None and self._token.refresh_token and self._token.expires_in() < horizon + self._renew_skew:
+            await self.async_refresh_token()
+        await self.async_warm_connections()
+
+    async def _async_ping(self, url: str) -> None:
+        """Send an unauthenticated HEAD request to open or reuse a connection."""
+        try:
+            async with self._session.head(url, headers=COMMON_HEADERS, timeout=self._timeouts["auth"]):
+                self._last_activity = time.monotonic()
+        except (aiohttp.ClientError, asyncio.TimeoutError) as err:
+            LOGGER.debug("Could not reach %s: %r", url, err)
+
+    async def _async_probe_host(self, host: str) -> None:
+        """Score an idle host by an authenticated pairings request.
+
+        A HEAD on the host root says nothing about the API, so the probe
+        uses a real API path and only a 200 counts as healthy.
+        """
+        if not self.token_valid:
+            return
+        try:
+            await self._limiter.async_acquire()
+        except FermaxRateLimitError:
+            return
+        start = time.monotonic()
+        try:
+            async with self._session.get(self._url(host, PAIRINGS_PATH), headers=self._auth_headers(), timeout=self._timeouts["pairings"]) as resp:
+                await resp.read()
+                ok = resp.status == 200
+        except (aiohttp.ClientError, asyncio.TimeoutError) as err:
+            LOGGER.debug("Could not probe %s: %r", host, err)
+            ok = False
+        self._hosts.record(host, time.monotonic() - start, ok)
+
+    def _timeout(self, endpoint: str) -> aiohttp.ClientTimeout:
+        """Return the endpoint timeout, cut short by the current deadline."""
+        timeout = self._timeouts[endpoint]
+        deadline = _DEADLINE.get()
+        if deadline is None or deadline.remaining() >= timeout.total:
+            return timeout
+        if deadline.remaining() <= 0:
+            raise FermaxTimeoutError(f"{deadline.name} ran out of time before the {endpoint} request")
+        return aiohttp.ClientTimeout(total=deadline.remaining())
+
+    def _renew_delay(self) -> Optional[float]:
+        """Return seconds until the token should be renewed."""
+        if self._token is None or not self._token.refresh_token:
+            return None
+        remaining = self._token.expires_in()
+        # Tokens shorter-lived than the skew are renewed at half their lifetime,
+        # and a token issued already expired does not trigger a refresh storm
+        return max(remaining - self._renew_skew, remaining / 2, TOKEN_RENEW_BACKOFF_MIN)
+
+    async def _async_renew_token_loop(self) -> None:
+        """Keep the token renewed until cancelled."""
+        while True:
+            self._token_changed.clear()
+            delay = self._renew_delay()
+            if delay is None or delay > 0:
+                with contextlib.suppress(asyncio.TimeoutError):
+                    await asyncio.wait_for(self._token_changed.wait(), delay)
+                if self._token_changed.is_set():
+                    # Token was replaced (login or lazy refresh), reschedule
+                    continue
+
+            if not await self._async_renew_token():
+                # Refresh token was rejected, wait for a new login
+                await self._token_changed.wait()
+
+    async def _async_renew_token(self) -> bool:
+        """Refresh the token, retrying connection errors with backoff."""
+        backoff = TOKEN_RENEW_BACKOFF_MIN
+        while True:
             try:
-                expires_at = datetime.datetime.fromisoformat(expires_at)
-            except ValueError:
+                await self.async_refresh_token()
+                return True
+            except FermaxAuthError as err:
+                LOGGER.warning("Background token renewal failed: %s", err)
                 return False
-        
-        if expires_at.tzinfo is None:
-            expires_at = expires_at.replace(tzinfo=datetime.timezone.utc)
-            
-        return datetime.datetime.now(datetime.timezone.utc) < expires_at
+            except FermaxConnectionError as err:
+                LOGGER.debug("Background token renewal failed, retrying in %ss: %s", backoff, err)
+            await asyncio.sleep(backoff)
+            backoff = min(backoff * 2, TOKEN_RENEW_BACKOFF_MAX)
 
     async def async_login(self, username: str, password: str) -> None:
         """Login with username and password."""
@@ -85,21 +937,50 @@ class FermaxClient:
         }
 
         try:
-            async with self._session.post(AUTH_URL, headers=headers, data=data) as resp:
+            async with self._session.post(AUTH_URL, headers=headers, data=data, timeout=self._timeout("auth")) as resp:
                 if resp.status != 200:
                     text = await resp.text()
                     LOGGER.error("Login failed: %s - %s", resp.status, text)
+                    if resp.status >= 500:
+                        raise FermaxUnavailableError(f"Login failed: {resp.status}")
                     raise FermaxAuthError(f"Login failed: {resp.status}")
                 
-                json_data = await resp.json()
-                self._process_token_response(json_data)
+                self._process_token_response(_json_loads(await resp.read()))
                 
-        except aiohttp.ClientError as err:
-            raise FermaxConnectionError(f"Connection error during login: {err}") from err
+        except (aiohttp.ClientError, asyncio.TimeoutError) as err:
+            _raise_if_expired(err)
+            raise FermaxUnavailableError(f"Connection error during login: {err!r}") from err
 
     async def async_refresh_token(self) -> None:
-        """Refresh the access token."""
-        if not self._token_data or "refresh_token" not in self._token_data:
+        """Refresh the access token.
+
+        Concurrent callers share a single in-flight refresh and its outcome.
+        """
+        start = time.monotonic()
+        await self._async_coalesce("refresh_token", self._async_refresh_token)
+        _record_step("refresh_token", start)
+
+    async def _async_coalesce(self, key: Hashable, factory: Callable[[], Awaitable[Any]]) -> Any:
+        """Run factory() once per key, sharing its outcome with concurrent callers."""
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.get_running_loop().create_task(factory())
+            self._inflight[key] = task
+            task.add_done_callback(lambda done: self._coalesce_done(key, done))
+        # Shield so a cancelled waiter does not abort the call for the others
+        return await asyncio.shield(task)
+
+    def _coalesce_done(self, key: Hashable, task: asyncio.Task) -> None:
+        """Clear an in-flight call once it has settled."""
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        if not task.cancelled():
+            # Mark the error as retrieved even if every waiter was cancelled
+            task.exception()
+
+    async def _async_refresh_token(self) -> None:
+        """Send the refresh_token grant to the OAuth endpoint."""
+        if self._token is None or not self._token.refresh_token:
             raise FermaxAuthError("No refresh token available")
 
         headers = {
@@ -108,96 +989,295 @@ class FermaxClient:
         }
         data = {
             "grant_type": "refresh_token",
-            "refresh_token": self._token_data["refresh_token"],
+            "refresh_token": self._token.refresh_token,
         }
 
         try:
-            async with self._session.post(AUTH_URL, headers=headers, data=data) as resp:
+            async with self._session.post(AUTH_URL, headers=headers, data=data, timeout=self._timeout("auth")) as resp:
                 if resp.status != 200:
                     text = await resp.text()
                     LOGGER.error("Token refresh failed: %s - %s", resp.status, text)
+                    if resp.status >= 500:
+                        raise FermaxUnavailableError(f"Token refresh failed: {resp.status}")
                     raise FermaxAuthError(f"Token refresh failed: {resp.status}")
                 
-                json_data = await resp.json()
-                self._process_token_response(json_data)
+                self._process_token_response(_json_loads(await resp.read()))
                 
-        except aiohttp.ClientError as err:
-            raise FermaxConnectionError(f"Connection error during refresh: {err}") from err
+        except (aiohttp.ClientError, asyncio.TimeoutError) as err:
+            _raise_if_expired(err)
+            raise FermaxUnavailableError(f"Connection error during refresh: {err!r}") from err
 
     def _process_token_response(self, data: Dict[str, Any]) -> None:
         """Process and save token data."""
-        now = datetime.datetime.now(datetime.timezone.utc)
-        expires_in = data.get("expires_in", 3600)
-        expires_at = now + datetime.timedelta(seconds=expires_in)
-        
-        self._token_data = {
-            "access_token": data["access_token"],
-            "refresh_token": data.get("refresh_token", self._token_data.get("refresh_token") if self._token_data else None),
-            "expires_at": expires_at.isoformat(),
-            "token_type": data.get("token_type", "Bearer"),
-        }
+        self._token = TokenState.from_response(data, self._token)
+        self._last_activity = time.monotonic()
         
+        self._token_changed.set()
+
         if self._save_token_callback:
-            self._save_token_callback(self._token_data)
+            self._save_token_callback(self._token.as_dict())
 
-    async def _async_request(self, method: str, url: str, **kwargs) -> Any:
-        """Make an authenticated request with retry logic."""
-        if not self.token_valid:
-            try:
-                await self.async_refresh_token()
-            except FermaxAuthError:
-                # If refresh fails, we might need re-login, but we can't do that without creds.
-                # Caller should handle ConfigEntryAuthFailed
-                raise ConfigEntryAuthFailed("Token expired and refresh failed")
+    async def _async_request(self, method: str, path: str, endpoint: str, retry: Optional[bool] = None, **kwargs) -> Any:
+        """Make an authenticated request with rate limit, timeout, retry and circuit breaker.
+
+        Only idempotent GETs are retried on failure unless `retry` says
+        otherwise. Throttled requests were not processed, so any method is
+        retried once the limiter allows it. A retry goes to another host if
+        one is available, and requests that never reached a host are always
+        retried there. A request whose token is rejected is sent once more
+        after a token refresh.
+        """
+        if retry is None:
+            retry = method == "GET"
+        attempts = 1 + self._max_retries
+        failed_hosts = set()
+        rejected_token: Optional[str] = None
+        attempt = 0
+
+        while True:
+            await self._async_ensure_token(rejected_token)
+            start = time.monotonic()
+            delay = 0
+            # Wait on this account's limiter first, so a throttled account
+            # never holds slots of the scheduler shared by all accounts
+            await self._limiter.async_acquire(RequestScheduler.ENDPOINT_PRIORITY.get(endpoint, PRIORITY_BACKGROUND))
+            async with self._scheduler.async_slot(endpoint):
+                _record_step(f"{endpoint} queue", start)
+                self._breaker.before_request()
+                host = self._hosts.select(failed_hosts)
+                url = self._url(host, path)
+                access_token = self._token.access_token
+                start = time.monotonic()
+                try:
+                    result = await self._async_request_once(method, url, endpoint, host != self._hosts.primary, **kwargs)
+                except _TokenRejected:
+                    # The backend answered, the token is what needs fixing
+                    self._breaker.record_success()
+                    self._hosts.record(host, time.monotonic() - start, True)
+                    if rejected_token is not None:
+                        raise ConfigEntryAuthFailed("Authentication failed after refresh")
+                    LOGGER.info("Received 401, trying to refresh token")
+                    rejected_token = access_token
+                    continue
+                except FermaxTimeoutError:
+                    # Our own deadline ran out, that says nothing about the host
+                    self._breaker.release()
+                    raise
+                except FermaxRateLimitError as err:
+                    self._breaker.record_success()
+                    attempt += 1
+                    if attempt == attempts:
+                        raise
+                    LOGGER.debug("%s %s throttled, retrying: %s", method, url, err)
+                    continue
+                except FermaxUnavailableError as err:
+                    self._breaker.record_failure()
+                    self._hosts.record(host, time.monotonic() - start, False)
+                    failed_hosts.add(host)
+                    attempt += 1
+                    # A connection that was never established cannot have delivered the
+                    # request, and a host that does not serve the path did not process it
+                    unsent = isinstance(err, _HostRejected) or isinstance(err.__cause__, aiohttp.ClientConnectorError)
+                    if not (retry or unsent) or attempt == attempts:
+                        raise
+                    if self._hosts.select(failed_hosts) in failed_hosts:
+                        # No other host left to fail over to
+                        delay = random.uniform(0, min(REQUEST_RETRY_BACKOFF_MAX, REQUEST_RETRY_BACKOFF * 2**(attempt - 1)))
+                    deadline = _DEADLINE.get()
+                    if deadline is not None and delay >= deadline.remaining():
+                        # Fail now rather than sleep past the deadline
+                        raise
+                    LOGGER.debug("%s %s failed, retrying in %.2fs: %s", method, url, delay, err)
+                except HomeAssistantError:
+                    # The backend answered, so it is healthy even if it rejected the request
+                    self._breaker.record_success()
+                    self._hosts.record(host, time.monotonic() - start, True)
+                    raise
+                except BaseException:
+                    self._breaker.release()
+                    raise
+                else:
+                    self._breaker.record_success()
+                    self._hosts.record(host, time.monotonic() - start, True)
+                    return result
+                finally:
+                    _record_step(f"{endpoint} request", start)
+            # Back off without holding a slot
+            if delay:
+                await asyncio.sleep(delay)
+
+    def _auth_headers(self) -> Dict[str, str]:
+        """Return the request headers, built once per token."""
+        if self._headers_token is not self._token:
+            self._headers = {
+                **COMMON_HEADERS,
+                "Authorization": f"Bearer {self._token.access_token}",
+                "Content-Type": "application/json",
+            }
+            self._headers_token = self._token
+        return self._headers
+
+    def _url(self, host: str, path: str) -> URL:
+        """Return the parsed URL of a path on a host, built once."""
+        url = self._urls.get((host, path))
+        if url is None:
+            # Device ids are plain ASCII, no quoting needed
+            url = self._urls[(host, path)] = URL(f"{host}{path}", encoded=True)
+        return url
+
+    async def _async_ensure_token(self, rejected_token: Optional[str] = None) -> None:
+        """Refresh an expired or rejected token before a request is sent.
+
+        The refresh talks to the OAuth host, so its failures are raised as
+        they are instead of counting against the API circuit breaker or
+        the API hosts.
+        """
+        # Skip the refresh if another request already replaced the rejected token
+        if self.token_valid and (rejected_token is None or self._token.access_token != rejected_token):
+            return
+        try:
+            await self.async_refresh_token()
+        except FermaxAuthError as err:
+            # If refresh fails, we might need re-login, but we can't do that without creds.
+            # Caller should handle ConfigEntryAuthFailed
+            if rejected_token is not None:
+                raise ConfigEntryAuthFailed(f"Re-authentication required: {err}") from err
+            raise ConfigEntryAuthFailed("Token expired and refresh failed") from err
 
-        headers = kwargs.pop("headers", {})
-        headers.update(COMMON_HEADERS)
-        headers["Authorization"] = f"Bearer {self._token_data['access_token']}"
-        headers["Content-Type"] = "application/json"
+    async def _async_request_once(self, method: str, url: URL, endpoint: str, alternate: bool = False, **kwargs) -> Any:
+        """Make a single authenticated request.
+
+        On an `alternate` host, answers that suggest it does not serve the
+        API path count as a host failure rather than a rejected request.
+        """
+        timeout = self._timeout(endpoint)
 
         try:
-            async with self._session.request(method, url, headers=headers, **kwargs) as resp:
+            async with self._session.request(method, url, headers=self._auth_headers(), timeout=timeout, **kwargs) as resp:
+                if alternate and resp.status in HOST_REJECT_STATUSES:
+                    raise _HostRejected(f"{url.host} answered {resp.status} to {endpoint}")
                 if resp.status == 401:
-                    # Token might be invalid, try refresh once
-                    LOGGER.info("Received 401, trying to refresh token")
-                    try:
-                        await self.async_refresh_token()
-                        # Update header with new token
-                        headers["Authorization"] = f"Bearer {self._token_data['access_token']}"
-                        async with self._session.request(method, url, headers=headers, **kwargs) as resp2:
-                            if resp2.status == 401:
-                                raise ConfigEntryAuthFailed("Authentication failed after refresh")
-                            resp2.raise_for_status()
-                            if resp2.headers.get("Content-Type", "").startswith("application/json"):
-                                return await resp2.json()
-                            return await resp2.text()
-                    except FermaxAuthError as err:
-                        raise ConfigEntryAuthFailed(f"Re-authentication required: {err}") from err
+                    # Token might be invalid, the caller refreshes it and retries once
+                    raise _TokenRejected
                 
-                resp.raise_for_status()
-                if resp.headers.get("Content-Type", "").startswith("application/json"):
-                    return await resp.json()
-                return await resp.text()
+                return await self._async_read_response(resp, endpoint)
                 
-        except aiohttp.ClientError as err:
+        except aiohttp.ClientResponseError as err:
             raise FermaxConnectionError(f"Request error: {err}") from err
+        except (aiohttp.ClientError, asyncio.TimeoutError) as err:
+            _raise_if_expired(err)
+            raise FermaxUnavailableError(f"Request error: {err!r}") from err
+
+    async def _async_read_response(self, resp: aiohttp.ClientResponse, endpoint: str) -> Any:
+        """Check the status and decode the body of JSON endpoints."""
+        self._last_activity = time.monotonic()
+        if resp.status == 429 or resp.status >= 500:
+            retry_after = _parse_retry_after(resp.headers.get("Retry-After"))
+            if retry_after is not None:
+                self._limiter.pause(retry_after)
+            if resp.status == 429:
+                if retry_after is None:
+                    self._limiter.pause(1)
+                raise FermaxRateLimitError(f"Throttled by server, retry after {retry_after}s")
+            raise FermaxUnavailableError(f"Server error: {resp.status}")
+        resp.raise_for_status()
+        body = await resp.read()
+        if endpoint not in JSON_ENDPOINTS:
+            return None
+        try:
+            return _json_loads(body)
+        except ValueError as err:
+            raise FermaxConnectionError(f"Invalid {endpoint} response: {err}") from err
 
     async def async_get_pairings(self) -> List[Dict[str, Any]]:
         """Get list of paired devices."""
-        url = f"{BASE_URL}/pairing/api/v3/pairings/me"
-        return await self._async_request("GET", url)
+        return await self._async_request("GET", PAIRINGS_PATH, "pairings")
+
+    async def async_open_door(self, device_id: str, access_id: Dict[str, int], payload: Optional[bytes] = None) -> None:
+        """Open door.
+
+        Opens for a door already in flight attach to that request, and opens
+        within the cooldown after a successful one are absorbed. `payload`
+        is the body from `open_door_payload`, if the caller keeps it.
+        """
+        key = ("open_door", device_id, *sorted(access_id.items()))
+        opened_at = self._door_opened_at.get(key)
+        if key not in self._inflight and opened_at is not None and time.monotonic() - opened_at < self._open_door_cooldown:
+            LOGGER.debug("Door %s %s opened %.1fs ago, skipping", device_id, access_id, time.monotonic() - opened_at)
+            return
+        await self._async_coalesce(key, lambda: self._async_open_door(device_id, access_id, payload or open_door_payload(access_id), key))
 
-    async def async_open_door(self, device_id: str, access_id: Dict[str, int]) -> None:
-        """Open door."""
-        url = f"{BASE_URL}/deviceaction/api/v1/device/{device_id}/directed-opendoor"
-        await self._async_request("POST", url, json=access_id)
+    async def _async_open_door(self, device_id: str, access_id: Dict[str, int], body: bytes, key: Hashable) -> None:
+        """Send the directed-opendoor request."""
+        # Only opens that send a request are reported, absorbed ones are not
+        if self._open_door_callback:
+            self._open_door_callback(device_id, access_id, self.warm)
+        path = f"/deviceaction/api/v1/device/{device_id}/directed-opendoor"
+        request = lambda: self._async_request("POST", path, "open_door", data=body)
+        if self._hedge:
+            await self._async_hedged(request)
+        else:
+            await request()
+        if self._open_door_cooldown:
+            self._door_opened_at[key] = time.monotonic()
+
+    async def _async_hedged(self, factory: Callable[[], Awaitable[Any]]) -> Any:
+        """Run a request and send a backup if it is slower than usual.
+
+        The backup runs concurrently, so it gets its own connection. The
+        first successful response wins and the other request is cancelled.
+        """
+        hedge = self._hedge
+        hedge.requests += 1
+        start = time.monotonic()
+        primary = asyncio.ensure_future(factory())
+        pending = {primary}
+        try:
+            done, _ = await asyncio.wait(pending, timeout=hedge.delay)
+            if not done:
+                hedge.fired += 1
+                LOGGER.debug("Open door slower than %.2fs, sending a hedged request", hedge.delay)
+                pending.add(asyncio.ensure_future(factory()))
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                # Check every task so no exception goes unretrieved
+                succeeded = [task for task in done if task.exception() is None]
+                if succeeded:
+                    winner = succeeded[0]
+                    if winner is not primary:
+                        hedge.won += 1
+                    # A lower bound of the primary's latency if the hedge won
+                    hedge.record(time.monotonic() - start)
+                    return winner.result()
+            # Both failed, report the original request's error
+            return primary.result()
+        finally:
+            for task in pending:
+                task.cancel()
 
     async def async_f1(self, device_id: str) -> None:
         """Trigger F1 function."""
-        url = f"{BASE_URL}/deviceaction/api/v1/device/{device_id}/f1"
-        await self._async_request("POST", url, json={"deviceID": device_id})
+        path = f"/deviceaction/api/v1/device/{device_id}/f1"
+        await self._async_request("POST", path, "f1", data=_json_dumps({"deviceID": device_id}))
 
     async def async_get_device_info(self, device_id: str) -> Dict[str, Any]:
         """Get device info."""
-        url = f"{BASE_URL}/deviceaction/api/v1/device/{device_id}"
-        return await self._async_request("GET", url)
+        path = f"/deviceaction/api/v1/device/{device_id}"
+        return await self._async_request("GET", path, "device_info")
+
+
+def _parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Parse a Retry-After header given in seconds or as an HTTP date."""
+    if not value:
+        return None
+    try:
+        seconds = float(value)
+    except ValueError:
+        try:
+            retry_at = email.utils.parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+        if retry_at.tzinfo is None:
+            retry_at = retry_at.replace(tzinfo=datetime.timezone.utc)
+        seconds = (retry_at - datetime.datetime.now(datetime.timezone.utc)).total_seconds()
+    return max(seconds, 0)
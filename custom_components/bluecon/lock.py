@@ -1,48 +1,78 @@
-import asyncio
-from typing import Any, Dict
+import logging
+from typing import Dict, Iterable
 from homeassistant.components.lock import LockEntity
 
+from homeassistant.helpers import device_registry as dr, entity_registry as er
 from homeassistant.helpers.entity import DeviceInfo
-from homeassistant.core import HomeAssistant
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
 from homeassistant.config_entries import ConfigEntry
-from .const import DEVICE_MANUFACTURER, DOMAIN, CONF_LOCK_STATE_RESET, HASS_BLUECON_VERSION
-from .fermax_api import FermaxClient
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
+from homeassistant.helpers.event import async_call_later
+from .const import DOMAIN, CONF_LOCK_STATE_RESET, OPEN_DOOR_DEADLINE, SIGNAL_READY, SIGNAL_SNAPSHOT_UPDATED
+from .fermax_api import async_deadline
+from .models import BlueConData
+from .registry import BlueConDoor, RegistryChanges
+
+LOGGER = logging.getLogger(__name__)
 
 async def async_setup_entry(hass: HomeAssistant, config: ConfigEntry, async_add_entities):
-    client: FermaxClient = hass.data[DOMAIN][config.entry_id]
-    lock_timeout = config.options.get(CONF_LOCK_STATE_RESET, 5)
+    data: BlueConData = hass.data[DOMAIN].entries[config.entry_id]
+    locks = data.locks
+    locks.update(_build_locks(data, data.registry.doors, config.options.get(CONF_LOCK_STATE_RESET, 5)))
+    async_add_entities(locks.values())
 
-    pairings = await client.async_get_pairings()
+    @callback
+    def _async_snapshot_updated(changes: RegistryChanges) -> None:
+        # Read the option here, it can change without a reload
+        lock_timeout = config.options.get(CONF_LOCK_STATE_RESET, 5)
+        _async_apply_changes(hass, config, data, locks, changes, lock_timeout, async_add_entities)
 
-    locks = []
+    config.async_on_unload(
+        async_dispatcher_connect(hass, SIGNAL_SNAPSHOT_UPDATED.format(config.entry_id), _async_snapshot_updated)
+    )
 
-    for pairing in pairings:
-        device_id = pairing["deviceId"]
-        # We can get device info, but pairing has most of it.
-        # Let's try to get more info if needed, but pairing has 'family', 'type', 'subtype' usually?
-        # The script's Pairing class doesn't seem to have family/type.
-        # But get_device_info does.
-        
-        device_info = await client.async_get_device_info(device_id)
-        
-        access_door_map = pairing.get("accessDoorMap", {})
-        
-        for access_door_name, access_door_data in access_door_map.items():
-            if not access_door_data.get("visible", True):
-                continue
-                
-            locks.append(
-                BlueConLock(
-                    client,
-                    device_id,
-                    access_door_name,
-                    access_door_data,
-                    device_info,
-                    lock_timeout
-                )
-            )
-    
-    async_add_entities(locks)
+def _build_locks(data: BlueConData, lock_ids: Iterable[str], lock_timeout: int) -> Dict[str, "BlueConLock"]:
+    """Create lock entities for the given doors of the registry."""
+    doors = data.registry.doors
+    return {lock_id: BlueConLock(data, doors[lock_id], lock_timeout) for lock_id in lock_ids}
+
+@callback
+def _async_apply_changes(hass: HomeAssistant, config: ConfigEntry, data: BlueConData, locks: Dict[str, "BlueConLock"], changes: RegistryChanges, lock_timeout: int, async_add_entities) -> None:
+    """Add, update and remove lock entities for the doors that changed."""
+    entity_registry = er.async_get(hass)
+    device_registry = dr.async_get(hass)
+
+    for lock_id in changes.removed:
+        lock = locks.pop(lock_id, None)
+        if lock is None:
+            continue
+        LOGGER.info("Removing lock %s, no longer paired", lock.entity_id)
+        if entity_registry.async_get(lock.entity_id):
+            entity_registry.async_remove(lock.entity_id)
+        else:
+            hass.async_create_task(lock.async_remove())
+
+    # Doors are updated in place, the entities only need to write their state
+    for lock_id in changes.updated:
+        lock = locks.get(lock_id)
+        if lock is not None and lock.hass is not None:
+            lock.async_write_ha_state()
+
+    added = _build_locks(data, changes.added, lock_timeout)
+    locks.update(added)
+    if added:
+        async_add_entities(added.values())
+
+    for device_id in changes.devices_removed:
+        device = device_registry.async_get_device(identifiers={(DOMAIN, device_id)})
+        if device is not None:
+            device_registry.async_update_device(device.id, remove_config_entry_id=config.entry_id)
+
+    for device_id in changes.devices_updated:
+        device = device_registry.async_get_device(identifiers={(DOMAIN, device_id)})
+        if device is not None:
+            info = data.registry.devices[device_id].device_info
+            device_registry.async_update_device(device.id, model=info["model"], name=info["name"])
 
 class BlueConLock(LockEntity):
     _attr_should_poll = False
@@ -53,20 +83,48 @@ class BlueConLock(LockEntity):
     STATE_LOCKING = "locking"
     STATE_UNLOCKING = "unlocking"
 
-    def __init__(self, client: FermaxClient, device_id: str, access_door_name: str, access_door_data: Dict[str, Any], device_info: Dict[str, Any], lock_timeout: int):
-        self.client = client
-        self.lock_id = f'{device_id}_{access_door_name}'
-        self.device_id = device_id
-        self.access_door_name = access_door_name
-        self.access_door_data = access_door_data # Contains accessId dict
-        self._attr_unique_id = f'{self.lock_id}_door_lock'.lower()
+    def __init__(self, data: BlueConData, door: BlueConDoor, lock_timeout: int):
+        self._data = data
+        self.client = data.client
+        self.door = door
+        self._attr_unique_id = f'{door.lock_id}_door_lock'.lower()
         self.entity_id = f'{DOMAIN}.{self._attr_unique_id}'.lower()
         self._state = self.STATE_LOCKED
-        
-        model = f"{device_info.get('type', '')} {device_info.get('subtype', '')} {device_info.get('family', '')}".strip()
-        self._model = model if model else "Fermax Blue Device"
-        
-        self._lock_timeout = lock_timeout
+
+        self.lock_timeout = lock_timeout
+        self._cancel_relock: CALLBACK_TYPE | None = None
+
+    @property
+    def lock_id(self) -> str:
+        """Return the id of the door in the registry."""
+        return self.door.lock_id
+
+    @property
+    def device_id(self) -> str:
+        """Return the id of the device the door belongs to."""
+        return self.door.device.device_id
+
+    async def async_added_to_hass(self) -> None:
+        """Track client readiness."""
+        self.async_on_remove(
+            async_dispatcher_connect(self.hass, SIGNAL_READY.format(self._data.entry_id), self.async_write_ha_state)
+        )
+
+    async def async_will_remove_from_hass(self) -> None:
+        """Cancel a pending relock."""
+        if self._cancel_relock is not None:
+            self._cancel_relock()
+            self._cancel_relock = None
+
+    @property
+    def available(self) -> bool:
+        """Return False until the client has a valid session."""
+        return self._data.ready
+
+    @property
+    def model(self) -> str:
+        """Return the device model."""
+        return self.door.device.model
     
     @property
     def is_locking(self) -> bool:
@@ -96,13 +154,28 @@ class BlueConLock(LockEntity):
         self._state = self.STATE_UNLOCKING
         self.async_write_ha_state()
         
-        access_id = self.access_door_data["accessId"]
-        await self.client.async_open_door(self.device_id, access_id)
+        door = self.door
+        try:
+            async with async_deadline(f"Unlock {self.entity_id}", OPEN_DOOR_DEADLINE):
+                await self.client.async_open_door(door.device.device_id, door.access_id, door.payload)
+        except Exception:
+            # Fall back to the state before this attempt
+            self._state = self.STATE_UNLOCKED if self._cancel_relock else self.STATE_LOCKED
+            self.async_write_ha_state()
+            raise
         
         self._state = self.STATE_UNLOCKED
         self.async_write_ha_state()
         
-        await asyncio.sleep(self._lock_timeout)
+        # A repeated unlock restarts the window instead of stacking relocks
+        if self._cancel_relock is not None:
+            self._cancel_relock()
+        self._cancel_relock = async_call_later(self.hass, self.lock_timeout, self._async_relock)
+
+    @callback
+    def _async_relock(self, _now) -> None:
+        """Flip the lock back to locked once the unlock window ends."""
+        self._cancel_relock = None
         self._state = self.STATE_LOCKED
         self.async_write_ha_state()
 
@@ -111,12 +184,4 @@ class BlueConLock(LockEntity):
     
     @property
     def device_info(self) -> DeviceInfo | None:
-        return DeviceInfo(
-            identifiers = {
-                (DOMAIN, self.device_id)
-            },
-            name = f'{self._model} {self.device_id}',
-            manufacturer = DEVICE_MANUFACTURER,
-            model = self._model,
-            sw_version = HASS_BLUECON_VERSION
-        )
+        return self.door.device.device_info
@@ -0,0 +1,42 @@
+"""Runtime data for the BlueCon integration."""
+import asyncio
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Dict, Optional, Tuple
+
+from .fermax_api import FermaxClient
+from .registry import DoorRegistry
+from .storage import PairingCache
+from .transport import FermaxTransport
+from .usage import UsageTracker
+
+if TYPE_CHECKING:
+    from .coordinator import BlueConDeviceCoordinator
+    from .lock import BlueConLock
+
+
+@dataclass
+class BlueConData:
+    """Runtime data for a BlueCon config entry."""
+
+    entry_id: str
+    client: FermaxClient
+    cache: PairingCache
+    snapshot: Optional[Dict[str, Any]] = None
+    # Devices and doors parsed from the snapshot, shared by the entities
+    registry: DoorRegistry = field(default_factory=DoorRegistry)
+    ready: bool = False
+    locks: Dict[str, "BlueConLock"] = field(default_factory=dict)
+    usage: Optional[UsageTracker] = None
+    usage_task: Optional[asyncio.Task] = None
+    # Options and credentials currently applied, to tell what changed
+    options: Dict[str, Any] = field(default_factory=dict)
+    credentials: Tuple[Optional[str], Optional[str]] = (None, None)
+    coordinator: Optional["BlueConDeviceCoordinator"] = None
+
+
+@dataclass
+class BlueConDomainData:
+    """Runtime data shared by all BlueCon config entries."""
+
+    transport: FermaxTransport
+    entries: Dict[str, BlueConData] = field(default_factory=dict)
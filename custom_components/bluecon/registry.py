@@ -0,0 +1,137 @@
+"""Devices and doors of a BlueCon account, parsed once per sync."""
+from dataclasses import dataclass, field
+import sys
+from typing import Any, Dict, Set
+
+from homeassistant.helpers.entity import DeviceInfo
+
+from .const import DEVICE_MANUFACTURER, DOMAIN, HASS_BLUECON_VERSION
+from .fermax_api import open_door_payload
+
+
+def device_model(device_info: Dict[str, Any]) -> str:
+    """Return the model string shown for a device."""
+    model = f"{device_info.get('type', '')} {device_info.get('subtype', '')} {device_info.get('family', '')}".strip()
+    return model if model else "Fermax Blue Device"
+
+
+class BlueConDevice:
+    """A paired device with its precomputed device registry info."""
+
+    __slots__ = ("device_id", "model", "device_info")
+
+    def __init__(self, device_id: str, model: str) -> None:
+        """Initialize the device."""
+        self.device_id = device_id
+        self.model = ""
+        self.device_info: DeviceInfo = {}
+        self.set_model(model)
+
+    def set_model(self, model: str) -> None:
+        """Set the model and rebuild the device info that depends on it."""
+        self.model = sys.intern(model)
+        self.device_info = DeviceInfo(
+            identifiers={(DOMAIN, self.device_id)},
+            name=f"{model} {self.device_id}",
+            manufacturer=DEVICE_MANUFACTURER,
+            model=self.model,
+            sw_version=HASS_BLUECON_VERSION,
+        )
+
+
+class BlueConDoor:
+    """A visible door, the handle lock entities keep instead of pairing data.
+
+    Doors are updated in place on resync, so entities always see the
+    current access id without holding a copy of it.
+    """
+
+    __slots__ = ("lock_id", "name", "device", "access_id", "payload")
+
+    def __init__(self, lock_id: str, name: str, device: BlueConDevice, access_id: Dict[str, int]) -> None:
+        """Initialize the door."""
+        self.lock_id = lock_id
+        self.name = name
+        self.device = device
+        self.access_id = access_id
+        self.payload = open_door_payload(access_id)
+
+    def set_access_id(self, access_id: Dict[str, int]) -> None:
+        """Set the access id and the request body sent to open the door."""
+        self.access_id = access_id
+        self.payload = open_door_payload(access_id)
+
+
+@dataclass
+class RegistryChanges:
+    """Lock and device ids touched by a sync."""
+
+    added: Set[str] = field(default_factory=set)
+    removed: Set[str] = field(default_factory=set)
+    updated: Set[str] = field(default_factory=set)
+    devices_removed: Set[str] = field(default_factory=set)
+    devices_updated: Set[str] = field(default_factory=set)
+
+    def __bool__(self) -> bool:
+        """Return True if any door or device changed."""
+        return bool(self.added or self.removed or self.updated or self.devices_removed or self.devices_updated)
+
+    def as_dict(self) -> Dict[str, int]:
+        """Return how many doors were added, removed and updated."""
+        return {"added": len(self.added), "removed": len(self.removed), "updated": len(self.updated)}
+
+
+class DoorRegistry:
+    """Devices and visible doors of an account, keyed by device and lock id.
+
+    Entries are reused across syncs and only rebuilt when the data they
+    were derived from changes.
+    """
+
+    __slots__ = ("devices", "doors")
+
+    def __init__(self) -> None:
+        """Initialize an empty registry."""
+        self.devices: Dict[str, BlueConDevice] = {}
+        self.doors: Dict[str, BlueConDoor] = {}
+
+    def async_sync(self, snapshot: Dict[str, Any]) -> RegistryChanges:
+        """Bring the registry in line with a pairings snapshot."""
+        changes = RegistryChanges()
+        devices: Dict[str, BlueConDevice] = {}
+        doors: Dict[str, BlueConDoor] = {}
+
+        for pairing in snapshot["pairings"]:
+            device_id = sys.intern(pairing["deviceId"])
+            device = devices.get(device_id)
+            if device is None:
+                model = device_model(snapshot["devices"].get(device_id, {}))
+                device = self.devices.get(device_id)
+                if device is None:
+                    device = BlueConDevice(device_id, model)
+                elif device.model != model:
+                    device.set_model(model)
+                    changes.devices_updated.add(device_id)
+                devices[device_id] = device
+
+            for name, door_data in pairing.get("accessDoorMap", {}).items():
+                if not door_data.get("visible", True):
+                    continue
+                lock_id = sys.intern(f"{device_id}_{name}")
+                access_id = door_data["accessId"]
+                door = self.doors.get(lock_id)
+                if door is None:
+                    door = BlueConDoor(lock_id, sys.intern(name), device, access_id)
+                    changes.added.add(lock_id)
+                elif door.access_id != access_id:
+                    door.set_access_id(access_id)
+                    changes.updated.add(lock_id)
+                elif device_id in changes.devices_updated:
+                    changes.updated.add(lock_id)
+                doors[lock_id] = door
+
+        changes.removed = self.doors.keys() - doors.keys()
+        changes.devices_removed = self.devices.keys() - devices.keys()
+        self.devices = devices
+        self.doors = doors
+        return changes
@@ -0,0 +1,38 @@
+"""Device health sensors for BlueCon."""
+from homeassistant.components.sensor import SensorEntity, SensorStateClass
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import EntityCategory
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+
+from .coordinator import BlueConDeviceCoordinator
+from .entity import BlueConDeviceEntity, async_setup_device_entities
+from .registry import BlueConDevice
+
+
+async def async_setup_entry(hass: HomeAssistant, config: ConfigEntry, async_add_entities: AddEntitiesCallback) -> None:
+    """Set up the wireless signal sensors."""
+    async_setup_device_entities(
+        hass,
+        config,
+        async_add_entities,
+        lambda coordinator, device: [BlueConSignalSensor(coordinator, device)],
+    )
+
+
+class BlueConSignalSensor(BlueConDeviceEntity, SensorEntity):
+    """Wireless signal strength reported by the device."""
+
+    _attr_name = "Wireless signal"
+    _attr_icon = "mdi:wifi"
+    _attr_state_class = SensorStateClass.MEASUREMENT
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+
+    def __init__(self, coordinator: BlueConDeviceCoordinator, device: BlueConDevice) -> None:
+        """Initialize the sensor."""
+        super().__init__(coordinator, device, "wireless_signal")
+
+    @property
+    def native_value(self) -> int | None:
+        """Return the signal level."""
+        return self.device_data.get("wirelessSignal")
@@ -0,0 +1,152 @@
+"""Services for the BlueCon integration."""
+import asyncio
+import logging
+import time
+from typing import Any, Awaitable, Callable, Dict, List
+
+import voluptuous as vol
+
+from homeassistant.const import ATTR_ENTITY_ID
+from homeassistant.core import HomeAssistant, ServiceCall, ServiceResponse, SupportsResponse
+from homeassistant.exceptions import HomeAssistantError, ServiceValidationError
+import homeassistant.helpers.config_validation as cv
+
+from .const import DOMAIN, OPEN_DOOR_DEADLINE
+from .fermax_api import FermaxClient, async_deadline
+from .models import BlueConData
+from .sync import async_refresh_snapshot
+
+LOGGER = logging.getLogger(__name__)
+
+SERVICE_OPEN_DOORS = "open_doors"
+SERVICE_RESYNC = "resync"
+
+ATTR_DOORS = "doors"
+ATTR_DEVICE_ID = "device_id"
+ATTR_ACCESS_ID = "access_id"
+ATTR_CONFIG_ENTRY_ID = "config_entry_id"
+
+# Maximum concurrent open-door requests per account
+OPEN_DOORS_CONCURRENCY = 4
+
+ACCESS_ID_SCHEMA = vol.Schema(
+    {
+        vol.Required("block"): vol.Coerce(int),
+        vol.Required("subblock"): vol.Coerce(int),
+        vol.Required("number"): vol.Coerce(int),
+    }
+)
+
+OPEN_DOORS_SCHEMA = vol.All(
+    vol.Schema(
+        {
+            vol.Optional(ATTR_ENTITY_ID, default=[]): cv.entity_ids,
+            vol.Optional(ATTR_DOORS, default=[]): [
+                vol.Schema(
+                    {
+                        vol.Required(ATTR_DEVICE_ID): cv.string,
+                        vol.Required(ATTR_ACCESS_ID): ACCESS_ID_SCHEMA,
+                    }
+                )
+            ],
+        }
+    ),
+    cv.has_at_least_one_key(ATTR_ENTITY_ID, ATTR_DOORS),
+)
+
+RESYNC_SCHEMA = vol.Schema({vol.Optional(ATTR_CONFIG_ENTRY_ID): cv.string})
+
+
+async def _async_open_door(client: FermaxClient, device_id: str, access_id: Dict[str, int]) -> None:
+    """Open a door within the open-door deadline."""
+    async with async_deadline(f"Open {device_id} {access_id}", OPEN_DOOR_DEADLINE):
+        await client.async_open_door(device_id, access_id)
+
+
+def async_setup_services(hass: HomeAssistant) -> None:
+    """Register the BlueCon services."""
+
+    async def _async_open_doors(call: ServiceCall) -> ServiceResponse:
+        """Open several doors concurrently and report per-door results."""
+        entries: List[BlueConData] = list(hass.data[DOMAIN].entries.values())
+        jobs: List[tuple[BlueConData, Dict[str, Any], Callable[[], Awaitable[None]]]] = []
+
+        for entity_id in call.data[ATTR_ENTITY_ID]:
+            lock = next(
+                (lock for data in entries for lock in data.locks.values() if lock.entity_id == entity_id),
+                None,
+            )
+            if lock is None:
+                raise ServiceValidationError(f"{entity_id} is not a BlueCon lock")
+            data = next(data for data in entries if lock.lock_id in data.locks)
+            jobs.append((data, {ATTR_ENTITY_ID: entity_id}, lock.async_unlock))
+
+        for door in call.data[ATTR_DOORS]:
+            device_id = door[ATTR_DEVICE_ID]
+            data = next(
+                (data for data in entries if device_id in data.registry.devices),
+                None,
+            )
+            if data is None:
+                raise ServiceValidationError(f"Device {device_id} is not paired with any BlueCon account")
+            access_id = door[ATTR_ACCESS_ID]
+            jobs.append(
+                (
+                    data,
+                    {ATTR_DEVICE_ID: device_id, ATTR_ACCESS_ID: access_id},
+                    lambda client=data.client, device_id=device_id, access_id=access_id: _async_open_door(client, device_id, access_id),
+                )
+            )
+
+        semaphores = {data.entry_id: asyncio.Semaphore(OPEN_DOORS_CONCURRENCY) for data, _, _ in jobs}
+
+        async def _async_open(data: BlueConData, door: Dict[str, Any], open_door: Callable[[], Awaitable[None]]) -> Dict[str, Any]:
+            async with semaphores[data.entry_id]:
+                start = time.monotonic()
+                try:
+                    await open_door()
+                except HomeAssistantError as err:
+                    LOGGER.warning("Could not open %s: %s", door, err)
+                    return {**door, "success": False, "error": str(err), "duration": round(time.monotonic() - start, 3)}
+                return {**door, "success": True, "duration": round(time.monotonic() - start, 3)}
+
+        results = await asyncio.gather(*(_async_open(*job) for job in jobs))
+        return {"results": list(results)}
+
+    async def _async_resync(call: ServiceCall) -> ServiceResponse:
+        """Resync pairings and add, update or remove only the changed doors."""
+        entries: Dict[str, BlueConData] = hass.data[DOMAIN].entries
+        if ATTR_CONFIG_ENTRY_ID in call.data:
+            entry_id = call.data[ATTR_CONFIG_ENTRY_ID]
+            if entry_id not in entries:
+                raise ServiceValidationError(f"{entry_id} is not a loaded BlueCon config entry")
+            targets = [entries[entry_id]]
+        else:
+            targets = list(entries.values())
+
+        async def _async_resync_entry(data: BlueConData) -> Dict[str, Any]:
+            try:
+                changes = await async_refresh_snapshot(hass, data, refetch_known=False)
+            except HomeAssistantError as err:
+                LOGGER.warning("Could not resync %s: %s", data.entry_id, err)
+                return {ATTR_CONFIG_ENTRY_ID: data.entry_id, "success": False, "error": str(err)}
+            return {ATTR_CONFIG_ENTRY_ID: data.entry_id, "success": True, **changes.as_dict()}
+
+        results = await asyncio.gather(*(_async_resync_entry(data) for data in targets))
+        return {"results": list(results)}
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_RESYNC,
+        _async_resync,
+        schema=RESYNC_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_OPEN_DOORS,
+        _async_open_doors,
+        schema=OPEN_DOORS_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
@@ -0,0 +1,95 @@
+"""Persistent storage for BlueCon."""
+import time
+from typing import Any, Dict, Optional
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+
+from .const import DOMAIN
+
+STORAGE_VERSION = 1
+
+# Token refreshes within this window are coalesced into a single write
+TOKEN_SAVE_DELAY = 10
+
+# Cached pairings older than this are revalidated against the cloud
+PAIRING_CACHE_TTL = 6 * 3600
+
+
+class TokenStore:
+    """Token persistence with debounced, last-writer-wins writes."""
+
+    def __init__(self, hass: HomeAssistant, entry_id: str) -> None:
+        """Initialize the store."""
+        self._store: Store[Dict[str, Any]] = Store(
+            hass, STORAGE_VERSION, f"{DOMAIN}.{entry_id}.token"
+        )
+        self._token: Optional[Dict[str, Any]] = None
+        self._dirty = False
+
+    async def async_load(self) -> Optional[Dict[str, Any]]:
+        """Load the stored token."""
+        self._token = await self._store.async_load()
+        return self._token
+
+    @callback
+    def async_save(self, token: Dict[str, Any]) -> None:
+        """Schedule a write of the latest token.
+
+        Home Assistant also flushes pending writes on shutdown.
+        """
+        self._token = token
+        self._dirty = True
+        self._store.async_delay_save(self._data_to_save, TOKEN_SAVE_DELAY)
+
+    @callback
+    def _data_to_save(self) -> Dict[str, Any]:
+        """Return the token to write."""
+        self._dirty = False
+        return self._token
+
+    async def async_flush(self) -> None:
+        """Write a pending token immediately."""
+        if self._dirty:
+            self._dirty = False
+            await self._store.async_save(self._token)
+
+
+class PairingCache:
+    """Pairings and device info snapshot persisted between restarts."""
+
+    def __init__(self, hass: HomeAssistant, entry_id: str) -> None:
+        """Initialize the cache."""
+        self._store: Store[Dict[str, Any]] = Store(
+            hass, STORAGE_VERSION, f"{DOMAIN}.{entry_id}.pairings"
+        )
+        self._fetched_at = 0.0
+
+    @property
+    def stale(self) -> bool:
+        """Return True if the snapshot is older than the TTL."""
+        return time.time() - self._fetched_at > PAIRING_CACHE_TTL
+
+    async def async_load(self) -> Optional[Dict[str, Any]]:
+        """Load the cached snapshot."""
+        data = await self._store.async_load()
+        if not data:
+            return None
+        self._fetched_at = data.get("fetched_at", 0.0)
+        return data.get("snapshot")
+
+    @callback
+    def async_mark_fresh(self) -> None:
+        """Record that the cloud confirmed the snapshot, without rewriting it.
+
+        The stored fetch time is left as is, so an unchanged snapshot is
+        revalidated once after a restart instead of rewritten every resync.
+        """
+        self._fetched_at = time.time()
+
+    async def async_save(self, snapshot: Dict[str, Any]) -> None:
+        """Store a freshly fetched snapshot."""
+        self._fetched_at = time.time()
+        await self._store.async_save(
+            {"fetched_at": self._fetched_at, "snapshot": snapshot}
+        )
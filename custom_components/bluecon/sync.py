@@ -0,0 +1,80 @@
+"""Pairing discovery and resync for BlueCon."""
+import asyncio
+import logging
+from typing import Any, Dict, Optional
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.dispatcher import async_dispatcher_send
+
+from .const import SIGNAL_SNAPSHOT_UPDATED
+from .fermax_api import FermaxClient, FermaxError
+from .models import BlueConData
+from .registry import RegistryChanges
+
+LOGGER = logging.getLogger(__name__)
+
+# Maximum concurrent device info requests during discovery
+DEVICE_INFO_CONCURRENCY = 4
+
+
+async def async_fetch_snapshot(
+    client: FermaxClient,
+    previous: Optional[Dict[str, Any]] = None,
+    concurrency: int = DEVICE_INFO_CONCURRENCY,
+    refetch_known: bool = True,
+) -> Dict[str, Any]:
+    """Fetch pairings and device info from the cloud.
+
+    Device info is fetched concurrently, at most `concurrency` at a time. A
+    device whose lookup fails keeps its previously known info, so one broken
+    device does not hold back the others. Without `refetch_known` only
+    devices missing from `previous` are looked up.
+    """
+    pairings = await client.async_get_pairings()
+    known_devices = previous["devices"] if previous else {}
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def _async_get_device_info(device_id: str) -> Dict[str, Any]:
+        if not refetch_known and device_id in known_devices:
+            return known_devices[device_id]
+        async with semaphore:
+            try:
+                # Pairings lack family/type/subtype, device info has them
+                return await client.async_get_device_info(device_id)
+            except FermaxError as err:
+                LOGGER.warning("Could not fetch device info for %s: %s", device_id, err)
+                return known_devices.get(device_id, {})
+
+    device_ids = list(dict.fromkeys(pairing["deviceId"] for pairing in pairings))
+    device_infos = await asyncio.gather(*(_async_get_device_info(device_id) for device_id in device_ids))
+
+    return {"pairings": pairings, "devices": dict(zip(device_ids, device_infos))}
+
+
+async def async_refresh_snapshot(hass: HomeAssistant, data: BlueConData, refetch_known: bool = True) -> RegistryChanges:
+    """Refresh the cached snapshot and notify the platforms of changes.
+
+    Returns the doors that were added, removed and updated. Without
+    `refetch_known` device info polled by the coordinator is reused and
+    only new devices are looked up.
+    """
+    previous = data.snapshot
+    if not refetch_known and data.coordinator is not None:
+        previous = {**previous, "devices": {**previous["devices"], **data.coordinator.data}}
+    fresh = await async_fetch_snapshot(data.client, previous, refetch_known=refetch_known)
+
+    if fresh == data.snapshot:
+        changes = RegistryChanges()
+    else:
+        pairings_changed = fresh["pairings"] != data.snapshot["pairings"]
+        data.snapshot = fresh
+        changes = data.registry.async_sync(fresh)
+        # Polled device health drifts all the time, it is not worth a flash write
+        if pairings_changed or changes:
+            await data.cache.async_save(fresh)
+        if data.coordinator is not None:
+            data.coordinator.async_add_devices(fresh["devices"])
+        async_dispatcher_send(hass, SIGNAL_SNAPSHOT_UPDATED.format(data.entry_id), changes)
+    data.cache.async_mark_fresh()
+    LOGGER.debug("Pairings resynced for %s: %s", data.entry_id, changes.as_dict())
+    return changes
@@ -0,0 +1,77 @@
+"""Transport shared by all BlueCon config entries."""
+import asyncio
+import logging
+import time
+from typing import Any, Dict, Optional, Set
+
+import aiohttp
+
+from homeassistant.core import Event, HomeAssistant
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
+
+from .fermax_api import RequestScheduler, create_session
+
+LOGGER = logging.getLogger(__name__)
+
+# Concurrent requests across all accounts
+TRANSPORT_SLOTS = 8
+
+# Seconds between the start of consecutive entries talking to the cloud
+STARTUP_STAGGER = 2
+
+
+class FermaxTransport:
+    """Connection pool, concurrency budget and startup order for all accounts.
+
+    Tokens, rate limits and circuit breakers stay per account; only the
+    resources that scale with the number of accounts are shared here.
+    """
+
+    def __init__(self, hass: HomeAssistant, slots: int = TRANSPORT_SLOTS) -> None:
+        """Initialize the transport."""
+        self._hass = hass
+        self.scheduler = RequestScheduler(slots)
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._session_users: Set[str] = set()
+        self._next_start = 0.0
+
+    def session(self, entry_id: str, dedicated: bool) -> aiohttp.ClientSession:
+        """Return the session an entry should use.
+
+        Entries asking for a dedicated session share a single one, created
+        on first use.
+        """
+        if not dedicated:
+            return async_get_clientsession(self._hass)
+        if self._session is None:
+            self._session = create_session()
+        self._session_users.add(entry_id)
+        return self._session
+
+    async def async_release(self, entry_id: str) -> None:
+        """Close the dedicated session once no entry uses it."""
+        self._session_users.discard(entry_id)
+        if not self._session_users:
+            await self.async_close()
+
+    async def async_close(self, event: Optional[Event] = None) -> None:
+        """Close the dedicated session."""
+        if self._session is not None:
+            session, self._session = self._session, None
+            await session.close()
+
+    async def async_stagger(self) -> None:
+        """Wait for this entry's turn to log in and fetch pairings."""
+        now = time.monotonic()
+        start = max(now, self._next_start)
+        self._next_start = start + STARTUP_STAGGER
+        if start > now:
+            LOGGER.debug("Delaying startup by %.1fs to spread out cloud requests", start - now)
+            await asyncio.sleep(start - now)
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Return the shared state for diagnostics."""
+        return {
+            "scheduler": self.scheduler.as_dict(),
+            "dedicated_session_entries": len(self._session_users),
+        }
@@ -0,0 +1,136 @@
+"""Usage-aware connection and token warming for BlueCon."""
+import asyncio
+from array import array
+import datetime
+import logging
+from typing import Any, Dict
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+import homeassistant.util.dt as dt_util
+
+from .const import DOMAIN
+from .fermax_api import FermaxClient, FermaxError
+from .storage import STORAGE_VERSION
+
+LOGGER = logging.getLogger(__name__)
+
+# The week is split into half-hour bins, one histogram per door
+USAGE_BIN_MINUTES = 30
+USAGE_BINS = 7 * 24 * 60 // USAGE_BIN_MINUTES
+
+# A bin with at least this many recorded unlocks is a likely-use window
+USAGE_MIN_COUNT = 3
+
+# Counts are halved when a bin reaches this, so old habits fade out
+USAGE_MAX_COUNT = 255
+
+# Start warming this many seconds before a likely-use window
+WARM_LEAD = 120
+
+USAGE_SAVE_DELAY = 60
+
+
+def _usage_bin(when: datetime.datetime) -> int:
+    """Return the histogram bin for a local time."""
+    return (when.weekday() * 24 * 60 + when.hour * 60 + when.minute) // USAGE_BIN_MINUTES
+
+
+class UsageTracker:
+    """Per-door histogram of unlock times used to warm up ahead of use."""
+
+    def __init__(self, hass: HomeAssistant, entry_id: str) -> None:
+        """Initialize the tracker."""
+        self._store: Store[Dict[str, Any]] = Store(
+            hass, STORAGE_VERSION, f"{DOMAIN}.{entry_id}.usage"
+        )
+        self._histograms: Dict[str, array] = {}
+        self._warm_unlocks = 0
+        self._cold_unlocks = 0
+        self._dirty = False
+
+    @property
+    def metrics(self) -> Dict[str, Any]:
+        """Return warm/cold unlock counters."""
+        total = self._warm_unlocks + self._cold_unlocks
+        return {
+            "doors": len(self._histograms),
+            "warm_unlocks": self._warm_unlocks,
+            "cold_unlocks": self._cold_unlocks,
+            "hit_rate": round(self._warm_unlocks / total, 3) if total else None,
+            "likely_now": self.likely(dt_util.now()),
+        }
+
+    async def async_load(self) -> None:
+        """Load the stored histograms and counters."""
+        data = await self._store.async_load()
+        if not data:
+            return
+        self._histograms = {
+            door: array("B", bytes.fromhex(histogram))
+            for door, histogram in data.get("histograms", {}).items()
+        }
+        self._warm_unlocks = data.get("warm_unlocks", 0)
+        self._cold_unlocks = data.get("cold_unlocks", 0)
+
+    @callback
+    def async_record(self, device_id: str, access_id: Dict[str, int], warm: bool) -> None:
+        """Record an unlock and whether the client was warm for it."""
+        door = f"{device_id}_{access_id.get('block')}_{access_id.get('subblock')}_{access_id.get('number')}"
+        histogram = self._histograms.get(door)
+        if histogram is None:
+            histogram = self._histograms[door] = array("B", bytes(USAGE_BINS))
+        index = _usage_bin(dt_util.now())
+        if histogram[index] == USAGE_MAX_COUNT:
+            for i, count in enumerate(histogram):
+                histogram[i] = count // 2
+        histogram[index] += 1
+
+        if warm:
+            self._warm_unlocks += 1
+        else:
+            self._cold_unlocks += 1
+        self._dirty = True
+        self._store.async_delay_save(self._data_to_save, USAGE_SAVE_DELAY)
+
+    def likely(self, when: datetime.datetime) -> bool:
+        """Return True if any door is usually opened around this time."""
+        index = _usage_bin(when)
+        return any(histogram[index] >= USAGE_MIN_COUNT for histogram in self._histograms.values())
+
+    async def async_run(self, client: FermaxClient) -> None:
+        """Keep the client warm during likely-use windows, idle otherwise."""
+        bin_length = USAGE_BIN_MINUTES * 60
+        while True:
+            now = dt_util.now()
+            if self.likely(now) or self.likely(now + datetime.timedelta(seconds=WARM_LEAD)):
+                # Ping before the session drops the idle connection
+                interval = client.keepalive_timeout * 2 / 3
+                try:
+                    await client.async_warm(interval)
+                except FermaxError as err:
+                    LOGGER.debug("Could not warm up ahead of a likely unlock: %s", err)
+                await asyncio.sleep(interval)
+                continue
+
+            # Sleep until shortly before the next bin starts
+            elapsed = (now.minute % USAGE_BIN_MINUTES) * 60 + now.second + now.microsecond / 1e6
+            delay = bin_length - elapsed - WARM_LEAD
+            if delay <= 0:
+                delay += bin_length
+            await asyncio.sleep(delay)
+
+    @callback
+    def _data_to_save(self) -> Dict[str, Any]:
+        """Return the histograms and counters to write."""
+        self._dirty = False
+        return {
+            "histograms": {door: histogram.tobytes().hex() for door, histogram in self._histograms.items()},
+            "warm_unlocks": self._warm_unlocks,
+            "cold_unlocks": self._cold_unlocks,
+        }
+
+    async def async_flush(self) -> None:
+        """Write pending changes immediately."""
+        if self._dirty:
+            await self._store.async_save(self._data_to_save())
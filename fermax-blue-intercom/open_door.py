@@ -614,16 +614,34 @@ async def main() -> None:
             f"Success, using provided deviceId {device_id}, calling directed opendoor..."
         )
 
-    # If user provided doors we open them all
+    # If user provided doors we open them all at once
     if provided_doors:
-        for access_id_json in access_ids:
-            access_id = AccessId(
-                block=access_id_json["block"],
-                subblock=access_id_json["subblock"],
-                number=access_id_json["number"],
-            )
-            result = await client.directed_opendoor(device_id, access_id)
-            LOGGER.info(f"Result: {result}")
+        results = await asyncio.gather(
+            *(
+                client.directed_opendoor(
+                    device_id,
+                    AccessId(
+                        block=access_id_json["block"],
+                        subblock=access_id_json["subblock"],
+                        number=access_id_json["number"],
+                    ),
+                )
+                for access_id_json in access_ids
+            ),
+            return_exceptions=True,
+        )
+        failures = []
+        for access_id_json, result in zip(access_ids, results):
+            if isinstance(result, BaseException):
+                LOGGER.error(f"Could not open {access_id_json}: {result!r}")
+                failures.append(result)
+            else:
+                LOGGER.info(f"Result for {access_id_json}: {result}")
+
+        if failures:
+            raise Exception(
+                f"Could not open {len(failures)} of {len(access_ids)} doors"
+            ) from failures[0]
 
     # Otherwise we just open the first one (ZERO?)
     else: